@@ -14,6 +14,7 @@ from datetime import datetime
 from rich.console import Console
 from rich.progress import Progress, TaskID, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 
+from email_parser.converters.base_converter import BaseConverter
 from email_parser.converters.pdf_converter import PDFConverter
 from email_parser.converters.docx_converter import DocxConverter
 from email_parser.converters.excel_converter import ExcelConverter
@@ -59,20 +60,41 @@ class DirectFileConverter:
         self.console = Console()
         self.file_detector = FileTypeDetector()
         
-        # Initialize converters with appropriate configurations
-        # Convert ProcessingConfig to dict format expected by converters
-        pdf_config = self._get_pdf_config()
-        docx_config = self._get_docx_config()
-        excel_output_dir = f"{self.config.output_directory}/converted_excel"
+        # Converters are built on first use, so a missing optional extra only
+        # affects the file types that need it
+        self._converters: Dict[str, BaseConverter] = {}
         
-        self.converters = {
-            'pdf': PDFConverter(config=pdf_config),
-            'docx': DocxConverter(config=docx_config),
-            'xlsx': ExcelConverter(output_dir=excel_output_dir),
-            'xls': ExcelConverter(output_dir=excel_output_dir)  # Use same converter for both Excel formats
-        }
+        logger.debug("DirectFileConverter initialized")
+    
+    def _get_converter(self, converter_type: str) -> Optional[BaseConverter]:
+        """
+        Get the converter for a file type, creating it on first use.
         
-        logger.debug("DirectFileConverter initialized with converters: %s", list(self.converters.keys()))
+        Args:
+            converter_type: Converter type reported by the file detector
+            
+        Returns:
+            The converter, or None if the type is not supported
+            
+        Raises:
+            ConfigurationError: If the converter's optional dependencies are missing
+        """
+        if converter_type in ('xlsx', 'xls'):
+            converter_type = 'excel'  # Use same converter for both Excel formats
+        
+        converter = self._converters.get(converter_type)
+        if converter is None:
+            # Convert ProcessingConfig to dict format expected by converters
+            if converter_type == 'pdf':
+                converter = PDFConverter(config=self._get_pdf_config())
+            elif converter_type == 'docx':
+                converter = DocxConverter(config=self._get_docx_config())
+            elif converter_type == 'excel':
+                converter = ExcelConverter(output_dir=f"{self.config.output_directory}/converted_excel")
+            else:
+                return None
+            self._converters[converter_type] = converter
+        return converter
     
     def _get_pdf_config(self) -> Dict[str, Any]:
         """Convert ProcessingConfig to PDF converter config format."""
@@ -145,7 +167,8 @@ class DirectFileConverter:
                 )
             
             # Get appropriate converter
-            if converter_type not in self.converters:
+            converter = self._get_converter(converter_type)
+            if converter is None:
                 return ConversionResult(
                     success=False,
                     input_path=file_path,
@@ -153,8 +176,6 @@ class DirectFileConverter:
                     error_message=f"No converter available for type: {converter_type}"
                 )
             
-            converter = self.converters[converter_type]
-            
             # Ensure output directory exists
             output_dir.mkdir(parents=True, exist_ok=True)
             
@@ -9,6 +9,7 @@ Phase 3.5's interactive CLI experience for a unified user interface.
 """
 
 import asyncio
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -28,7 +29,7 @@ from .components.quality_analyzer import ConversionQualityAnalyzer
 from .file_converter import DirectFileConverter
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConvertibleFile:
     """Represents a file that can be converted"""
 
@@ -76,6 +77,7 @@ class FileConversionProfileManager:
     def __init__(self):
         self.console = Console()
         self._initialize_default_profiles()
+        self.reset_file_stats()
 
     def _initialize_default_profiles(self):
         """Initialize built-in conversion profiles"""
@@ -168,18 +170,63 @@ class FileConversionProfileManager:
         """Get a specific profile by name"""
         return self.profiles.get(name)
 
-    def recommend_profile(self, files: List[ConvertibleFile]) -> str:
-        """Recommend best profile for given files"""
-        total_size = sum(f.size for f in files)
-        file_types = set(f.file_type for f in files)
-        total_files = len(files)
+    def reset_file_stats(self) -> None:
+        """Clear the running statistics used for streaming recommendations"""
+        self._file_count = 0
+        self._total_size = 0
+        self._total_time = 0.0
+        self._pdf_count = 0
+        self._complex_count = 0
+
+    def add_file(self, file: ConvertibleFile) -> None:
+        """Fold a newly discovered file into the running statistics"""
+        self._file_count += 1
+        self._total_size += file.size
+        self._total_time += file.estimated_conversion_time
+        if file.file_type == "pdf":
+            self._pdf_count += 1
+        if "complex" in file.complexity_indicators:
+            self._complex_count += 1
+
+    @property
+    def estimated_total_time(self) -> float:
+        """Estimated conversion time of the files added since the last reset"""
+        return self._total_time
+
+    def recommend_profile(self, files: Optional[List[ConvertibleFile]] = None) -> str:
+        """Recommend best profile for given files
+
+        When ``files`` is omitted, the recommendation is made in O(1) from the
+        statistics accumulated through :meth:`add_file`.
+        """
+        if files is None:
+            return self._recommend_from_stats(
+                self._file_count,
+                self._total_size,
+                self._pdf_count > 0,
+                self._complex_count > 0,
+            )
 
-        # Logic for profile recommendation
+        total_size = 0
+        has_pdf = False
+        has_complex = False
+        for f in files:
+            total_size += f.size
+            has_pdf = has_pdf or f.file_type == "pdf"
+            has_complex = has_complex or "complex" in f.complexity_indicators
+
+        return self._recommend_from_stats(len(files), total_size, has_pdf, has_complex)
+
+    @staticmethod
+    def _recommend_from_stats(
+        total_files: int, total_size: int, has_pdf: bool, has_complex: bool
+    ) -> str:
+        """Pick a profile from aggregate file statistics"""
         if total_files > 50:
             return "batch_optimization"
         elif total_size > 100 * 1024 * 1024:  # > 100MB
             return "quick_conversion"
-        elif "pdf" in file_types and any("complex" in f.complexity_indicators for f in files):
+        elif has_pdf and has_complex:
             return "research_mode"
         else:
             return "ai_processing"
@@ -289,8 +336,8 @@ class InteractiveFileConverter:
         if discovery_result.recommendations:
             self._display_recommendations(discovery_result.recommendations)
 
-        # Select profile
-        profile_name = self._select_conversion_profile(discovery_result.convertible_files)
+        # Select profile from the statistics gathered while scanning
+        profile_name = self._select_conversion_profile()
         profile = self.profile_manager.get_profile(profile_name)
 
         # Get output directory
@@ -372,6 +419,7 @@ class InteractiveFileConverter:
         convertible_files = []
         total_files = 0
         total_size = 0
+        self.profile_manager.reset_file_stats()
 
         with Progress(
             SpinnerColumn(),
@@ -395,6 +443,7 @@ class InteractiveFileConverter:
                             complexity_indicators=self._analyze_complexity(file_path),
                         )
                         convertible_files.append(convertible_file)
+                        self.profile_manager.add_file(convertible_file)
                         total_size += file_size
 
         # Generate recommendations
@@ -404,7 +453,7 @@ class InteractiveFileConverter:
             total_files=total_files,
             convertible_files=convertible_files,
             total_size=total_size,
-            estimated_total_time=sum(f.estimated_conversion_time for f in convertible_files),
+            estimated_total_time=self.profile_manager.estimated_total_time,
             recommendations=recommendations,
         )
 
@@ -416,12 +465,11 @@ class InteractiveFileConverter:
         table.add_column("Total Size", justify="right")
 
         # Group by file type
-        type_stats = {}
+        type_stats = defaultdict(lambda: {"count": 0, "size": 0})
         for file in result.convertible_files:
-            if file.file_type not in type_stats:
-                type_stats[file.file_type] = {"count": 0, "size": 0}
-            type_stats[file.file_type]["count"] += 1
-            type_stats[file.file_type]["size"] += file.size
+            stats = type_stats[file.file_type]
+            stats["count"] += 1
+            stats["size"] += file.size
 
         for file_type, stats in type_stats.items():
             size_mb = stats["size"] / (1024 * 1024)
@@ -458,8 +506,12 @@ class InteractiveFileConverter:
             panel_content = "\n".join(f"• {rec}" for rec in recommendations)
             self.console.print(Panel(panel_content, title="💡 Recommendations", style="yellow"))
 
-    def _select_conversion_profile(self, files: List[ConvertibleFile]) -> str:
-        """Interactive profile selection"""
+    def _select_conversion_profile(self, files: Optional[List[ConvertibleFile]] = None) -> str:
+        """Interactive profile selection
+
+        Without ``files`` the recommendation comes from the running statistics
+        of the last directory scan.
+        """
         profiles = self.profile_manager.get_profiles()
         recommended = self.profile_manager.recommend_profile(files)
 
@@ -694,8 +746,9 @@ class InteractiveFileConverter:
         except Exception as e:
             return {"success": False, "error": str(e), "duration": 0.0}
 
+    @staticmethod
     def _map_profile_to_config(
-        self, profile_settings: Dict[str, Any], output_dir: str
+        profile_settings: Dict[str, Any], output_dir: str
     ) -> ProcessingConfig:
         """
         Map ConversionProfile settings to ProcessingConfig format.
@@ -16,10 +16,19 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import logging
 
-import mammoth
-from bs4 import BeautifulSoup
-import docx
-from docx import Document
+try:
+    import mammoth
+    from bs4 import BeautifulSoup
+    import docx
+    from docx import Document
+except ImportError:
+    mammoth = None
+    BeautifulSoup = None
+    docx = None
+    Document = None
+
+# Whether the ``docx`` extra is installed and a DocxConverter can be built
+DOCX_AVAILABLE = mammoth is not None
 
 from email_parser.converters.base_converter import BaseConverter
 from email_parser.exceptions.converter_exceptions import (
@@ -91,6 +100,12 @@ class DocxConverter(BaseConverter):
             
         super().__init__(merged_config)
         
+        # Check if DOCX dependencies are available
+        if mammoth is None:
+            raise ConfigurationError(
+                "DOCX support not available. Install with: pip install email_parser[docx]"
+            )
+        
         # Set configuration parameters from merged config
         self.extract_tables = self.config.get('extract_tables', True)
         self.extract_images = self.config.get('extract_images', True)
@@ -4,14 +4,12 @@ Excel converter module for converting Excel workbooks to CSV files.
 
 import logging
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 # from typing import Dict, List, Optional, Tuple, Any, Callable
 from typing import Any, Callable, Dict, List, Optional
 
-import pandas as pd  # type: ignore
-from openpyxl import load_workbook  # type: ignore
-
 from email_parser.exceptions.parsing_exceptions import ExcelConversionError
 
 # from email_parser.utils.file_utils import ensure_directory, generate_unique_filename
@@ -20,6 +18,23 @@ from email_parser.utils.file_utils import ensure_directory, generate_unique_file
 
 logger = logging.getLogger(__name__)
 
+# Whether the ``excel`` extra is installed; pandas and openpyxl are imported lazily
+EXCEL_AVAILABLE = all(find_spec(module) is not None for module in ("pandas", "openpyxl"))
+
+
+def _pd() -> Any:
+    """Import pandas on first use; it is an optional (``excel`` extra) dependency."""
+    import pandas as pd  # type: ignore
+
+    return pd
+
+
+def _load_workbook(*args: Any, **kwargs: Any) -> Any:
+    """Import openpyxl on first use and load a workbook."""
+    from openpyxl import load_workbook  # type: ignore
+
+    return load_workbook(*args, **kwargs)
+
 
 class ExcelConverter:
     """
@@ -171,11 +186,11 @@ class ExcelConverter:
         try:
             # Try openpyxl first (.xlsx files)
             try:
-                workbook = load_workbook(excel_path, read_only=True)
+                workbook = _load_workbook(excel_path, read_only=True)
                 return [str(name) for name in workbook.sheetnames]  # Ensure all values are strings
             except Exception as e:
                 # Fall back to pandas for older Excel formats (.xls)
-                xl = pd.ExcelFile(excel_path)
+                xl = _pd().ExcelFile(excel_path)
                 return [str(name) for name in xl.sheet_names]  # Ensure all values are strings
         except Exception as e:
             logger.error(f"Failed to get sheet names from {excel_path}: {str(e)}")
@@ -195,7 +210,7 @@ class ExcelConverter:
         """
         try:
             # Read Excel sheet
-            df = pd.read_excel(excel_path, sheet_name=sheet_name)
+            df = _pd().read_excel(excel_path, sheet_name=sheet_name)
 
             # Write to CSV
             df.to_csv(csv_path, index=False, encoding="utf-8")
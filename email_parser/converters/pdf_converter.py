@@ -24,6 +24,9 @@ except ImportError:
     Mistral = None
     MistralException = Exception
 
+# Whether the ``ai`` extra is installed and a PDFConverter can be built
+MISTRAL_AVAILABLE = Mistral is not None
+
 from email_parser.converters.base_converter import BaseConverter
 from email_parser.exceptions.converter_exceptions import (
     ConversionError,
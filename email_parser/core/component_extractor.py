@@ -500,19 +500,23 @@ class ComponentExtractor:
                 content = f.read()
 
             # Replace content IDs with file paths for inline images
+            cid_map: Dict[str, str] = {}
             for image in self.processed_components.get("inline_images", []):
                 content_id = image.get("content_id")
                 if content_id:
-                    # Look for references to the content ID in image tags
-                    # Both cid: format and direct content ID references
-                    content = content.replace(
-                        f'src="cid:{content_id}"',
-                        f'src="../inline_images/{image["secure_filename"]}"',
-                    )
-                    content = content.replace(
-                        f"src='cid:{content_id}'",
-                        f'src="../inline_images/{image["secure_filename"]}"',
-                    )
+                    cid_map.setdefault(content_id, image["secure_filename"])
+
+            if cid_map:
+                # Rewrite every cid: image source, single or double quoted, in one pass
+                cid_pattern = re.compile(
+                    r"""src=(["'])cid:("""
+                    + "|".join(map(re.escape, cid_map))
+                    + r")\1"
+                )
+                content = cid_pattern.sub(
+                    lambda match: f'src="../inline_images/{cid_map[match.group(2)]}"',
+                    content,
+                )
 
             # Add attachment references at the end of the file
             if self.processed_components.get("attachments"):
@@ -1,9 +1,21 @@
 from dataclasses import dataclass, field
+from importlib.util import find_spec
 from typing import List, Optional, Dict, Any
 import os
 from pathlib import Path
 
 
+def _extra_installed(*modules: str) -> bool:
+    """Check whether an optional extra is installed without importing it."""
+    return all(find_spec(module) is not None for module in modules)
+
+
+# Excel, PDF and DOCX conversion default to on only when their extras are installed
+EXCEL_CONVERSION_DEFAULT = _extra_installed("pandas", "openpyxl")
+PDF_CONVERSION_DEFAULT = _extra_installed("mistralai")
+DOCX_CONVERSION_DEFAULT = _extra_installed("mammoth", "bs4", "docx")
+
+
 @dataclass
 class PDFConversionConfig:
     """Configuration for PDF to Markdown conversion."""
@@ -139,9 +151,9 @@ class ProcessingConfig:
     batch_size: int = 100
     
     # Conversion settings (backward compatibility)
-    convert_excel: bool = True
-    convert_pdf: bool = True
-    convert_docx: bool = True
+    convert_excel: bool = EXCEL_CONVERSION_DEFAULT
+    convert_pdf: bool = PDF_CONVERSION_DEFAULT
+    convert_docx: bool = DOCX_CONVERSION_DEFAULT
     
     # Legacy settings (for backward compatibility)
     max_attachment_size: int = 10_000_000
@@ -245,9 +257,9 @@ class ProcessingConfig:
         instance = cls(
             output_directory=output_directory,
             batch_size=config_dict.get('batch_size', 100),
-            convert_excel=config_dict.get('convert_excel', True),
-            convert_pdf=config_dict.get('convert_pdf', True),
-            convert_docx=config_dict.get('convert_docx', True),
+            convert_excel=config_dict.get('convert_excel', EXCEL_CONVERSION_DEFAULT),
+            convert_pdf=config_dict.get('convert_pdf', PDF_CONVERSION_DEFAULT),
+            convert_docx=config_dict.get('convert_docx', DOCX_CONVERSION_DEFAULT),
             max_attachment_size=config_dict.get('max_attachment_size', 10_000_000),
             pdf_extraction_mode=config_dict.get('pdf_extraction_mode', 'all'),
             docx_extract_metadata=config_dict.get('docx_extract_metadata', True),
@@ -12,9 +12,9 @@ from io import TextIOBase, BufferedIOBase
 
 # from typing import List, Union, BinaryIO, cast
 
-from email_parser.converters.excel_converter import ExcelConverter
-from email_parser.converters.pdf_converter import PDFConverter
-from email_parser.converters.docx_converter import DocxConverter
+from email_parser.converters.excel_converter import EXCEL_AVAILABLE, ExcelConverter
+from email_parser.converters.pdf_converter import MISTRAL_AVAILABLE, PDFConverter
+from email_parser.converters.docx_converter import DOCX_AVAILABLE, DocxConverter
 from email_parser.core.component_extractor import ComponentExtractor
 from email_parser.core.config import ProcessingConfig
 from email_parser.core.mime_parser import MIMEParser
@@ -94,17 +94,35 @@ class EmailProcessor:
 
         # Excel conversion settings
         self.enable_excel_conversion = getattr(config, "convert_excel", False)
+        if self.enable_excel_conversion and not EXCEL_AVAILABLE:
+            logger.warning(
+                "Excel conversion disabled: pandas/openpyxl not available. "
+                "Install with: pip install email_parser[excel]"
+            )
+            self.enable_excel_conversion = False
         self.excel_prompt_callback = excel_prompt_callback
         if self.enable_excel_conversion:
             self.excel_converter = ExcelConverter(output_dir=self.excel_conversion_dir)
         
         # PDF conversion settings
         self.enable_pdf_conversion = getattr(config, "convert_pdf", False)
+        if self.enable_pdf_conversion and not MISTRAL_AVAILABLE:
+            logger.warning(
+                "PDF conversion disabled: MistralAI SDK not available. "
+                "Install with: pip install email_parser[ai]"
+            )
+            self.enable_pdf_conversion = False
         if self.enable_pdf_conversion:
             self.pdf_converter = PDFConverter()
         
         # DOCX conversion settings
         self.enable_docx_conversion = getattr(config, "convert_docx", False)
+        if self.enable_docx_conversion and not DOCX_AVAILABLE:
+            logger.warning(
+                "DOCX conversion disabled: DOCX support not available. "
+                "Install with: pip install email_parser[docx]"
+            )
+            self.enable_docx_conversion = False
         if self.enable_docx_conversion:
             # Create DOCX converter config from ProcessingConfig
             docx_config = None
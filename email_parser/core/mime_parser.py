@@ -8,8 +8,8 @@ from email.message import Message
 from email.policy import default
 from typing import Any, Dict, List, Optional, Tuple, Set
 
-from email_parser.exceptions.parsing_exceptions import MIMEParsingError
-from email_parser.utils.encodings import decode_content
+from email_parser.exceptions.parsing_exceptions import EncodingError, MIMEParsingError
+from email_parser.utils.encodings import decode_content, decode_transfer_encoding
 
 logger = logging.getLogger(__name__)
 
@@ -134,7 +134,7 @@ class MIMEParser:
             # Get content based on type
             content = None
             if not part.is_multipart():
-                payload = part.get_payload(decode=True)
+                payload = self._decode_payload(part)
                 if payload:
                     charset = part.get_content_charset() or "utf-8"
                     try:
@@ -171,6 +171,31 @@ class MIMEParser:
             logger.error(f"Failed to process part {part_id}: {str(e)}")
             raise MIMEParsingError(f"Failed to process part {part_id}: {str(e)}")
 
+    def _decode_payload(self, part: Message) -> Optional[bytes]:
+        """
+        Decode the transfer encoding of a non-multipart part.
+
+        Base64 bodies (typically attachments, the bulk of a large email) are
+        decoded through decode_transfer_encoding so the accelerated decoder
+        is used when available. Anything else, or base64 that cannot be
+        decoded, is left to the email package.
+
+        Args:
+            part: Email message part
+
+        Returns:
+            Decoded payload bytes, or None if the part has no payload
+        """
+        cte = str(part.get("Content-Transfer-Encoding", "")).strip().lower()
+        if cte == "base64":
+            raw = part.get_payload()
+            if isinstance(raw, str):
+                try:
+                    return decode_transfer_encoding(raw.encode("ascii", "ignore"), cte)
+                except EncodingError as e:
+                    logger.debug(f"Falling back to email package base64 decoding: {str(e)}")
+        return part.get_payload(decode=True)
+
     def get_headers(self) -> Dict[str, str]:
         """
         Get the extracted email headers.
@@ -13,9 +13,35 @@ from typing import Optional, Union
 
 from email_parser.exceptions.parsing_exceptions import EncodingError
 
+try:
+    # SIMD-accelerated base64; falls back to the stdlib decoder when absent
+    import pybase64
+except ImportError:
+    pybase64 = None
+
 logger = logging.getLogger(__name__)
 
 
+def b64decode(content: Union[bytes, str]) -> bytes:
+    """
+    Decode base64 data, discarding characters outside the base64 alphabet.
+
+    Uses pybase64 when it is installed, otherwise the stdlib decoder.
+
+    Args:
+        content: Base64 encoded data
+
+    Returns:
+        Decoded bytes
+
+    Raises:
+        binascii.Error: If the data is incorrectly padded
+    """
+    if pybase64 is not None:
+        return pybase64.b64decode(content, validate=False)
+    return base64.b64decode(content)
+
+
 def decode_content(
     content: bytes, charset: str = "utf-8", encoding: Optional[str] = None
 ) -> Union[str, bytes]:
@@ -79,21 +105,18 @@ def decode_transfer_encoding(content: bytes, encoding: str) -> bytes:
     try:
         if encoding == "base64":
             try:
-                import base64
-                import binascii
-                return base64.b64decode(content)
+                return b64decode(content)
             except binascii.Error as e:
                 # Try to handle malformed base64 by adding padding
                 padded = content + b"=" * (4 - (len(content) % 4))
-                return base64.b64decode(padded)
+                return b64decode(padded)
 
         elif encoding in ("quoted-printable", "quopri"):
             return quopri.decodestring(content)
 
         elif encoding == "uuencode" or encoding == "uue":
             import io
-            import binascii
-            
+
             input_file = io.BytesIO(content)
             output_file = io.BytesIO()
             
@@ -118,7 +141,6 @@ def decode_transfer_encoding(content: bytes, encoding: str) -> bytes:
             try:
                 # For binhex encoding, we'll use base64 as a substitute
                 # This is a simplified approach - true binhex would need more processing
-                import base64
                 return base64.b64decode(content)
             except Exception as e:
                 logger.warning(f"Failed to decode binhex content, trying standard base64")
@@ -7,28 +7,55 @@ Validates all performance requirements specified in the development plan.
 """
 
 import asyncio
+import io
+import os
+import shutil
 import tempfile
 import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from rich.console import Console
+from rich.progress import Progress
+
 from email_parser.cli.interactive_file import (
     ConvertibleFile,
     FileConversionProfileManager,
+    FileDiscoveryResult,
     InteractiveFileConverter,
 )
 
 
+def _current_rss_mb():
+    """Return this process's current resident set size in MB.
+
+    On Linux this is a single read of /proc/self/statm; elsewhere psutil is used.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except OSError:
+        import psutil
+
+        return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
+
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
 class Phase45PerformanceValidator:
     """Validates Phase 4.5 performance requirements."""
 
     def __init__(self):
         self.results = {}
         self.temp_dir = None
+        # Every file/directory we create, so teardown need not re-walk the tree
+        self._created = []
+        self._created_dirs = []
 
     def setup_test_environment(self):
         """Create test environment with sample files."""
         self.temp_dir = Path(tempfile.mkdtemp())
+        self._created_dirs.append(self.temp_dir)
 
         # Create test files of various sizes
         test_files = {
@@ -42,27 +69,48 @@ class Phase45PerformanceValidator:
             file_path = self.temp_dir / f"small_{i}.txt"
             file_path.write_text("Small file content " * 1000)  # ~20KB
             test_files["small_files"].append(file_path)
+            self._created.append(file_path)
 
         # Create 100 medium files (1-5MB each)
         for i in range(100):
             file_path = self.temp_dir / f"medium_{i}.txt"
             file_path.write_text("Medium file content " * 50000)  # ~1MB
             test_files["medium_files"].append(file_path)
+            self._created.append(file_path)
 
         # Create 10 large files (5-10MB each)
         for i in range(10):
             file_path = self.temp_dir / f"large_{i}.txt"
             file_path.write_text("Large file content " * 200000)  # ~4MB
             test_files["large_files"].append(file_path)
+            self._created.append(file_path)
 
         return test_files
 
     def cleanup_test_environment(self):
         """Clean up test environment."""
-        if self.temp_dir:
-            import shutil
-
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        for file_path in self._created:
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                pass
+        # Children were appended after their parents, so remove in reverse
+        for dir_path in reversed(self._created_dirs):
+            try:
+                os.rmdir(dir_path)
+            except FileNotFoundError:
+                pass
+        self._created.clear()
+        self._created_dirs.clear()
+
+    @staticmethod
+    def _stage_copy(source, destination):
+        """Stage a fixture without round-tripping its contents through Python."""
+        try:
+            os.link(source, destination)
+        except OSError:
+            # Hardlinks unsupported here; copyfile still copies in kernel space
+            shutil.copyfile(source, destination)
 
     async def test_file_discovery_performance(self):
         """Test: File discovery < 2 seconds for directories with < 100 files."""
@@ -76,24 +124,28 @@ class Phase45PerformanceValidator:
             # Test 1: Small directory (10 files)
             small_dir = self.temp_dir / "small"
             small_dir.mkdir()
+            self._created_dirs.append(small_dir)
             for file_path in test_files["small_files"]:
                 new_path = small_dir / file_path.name
-                new_path.write_text(file_path.read_text())
+                self._stage_copy(file_path, new_path)
+                self._created.append(new_path)
 
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             result = await converter._scan_directory(small_dir)
-            discovery_time_small = time.time() - start_time
+            discovery_time_small = (time.perf_counter_ns() - start_time) / 1e9
 
             # Test 2: Medium directory (100 files)
             medium_dir = self.temp_dir / "medium"
             medium_dir.mkdir()
+            self._created_dirs.append(medium_dir)
             for file_path in test_files["medium_files"]:
                 new_path = medium_dir / file_path.name
-                new_path.write_text(file_path.read_text())
+                self._stage_copy(file_path, new_path)
+                self._created.append(new_path)
 
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             result = await converter._scan_directory(medium_dir)
-            discovery_time_medium = time.time() - start_time
+            discovery_time_medium = (time.perf_counter_ns() - start_time) / 1e9
 
             # Validate requirements
             requirement_met_small = discovery_time_small < 2.0
@@ -117,12 +169,12 @@ class Phase45PerformanceValidator:
         print("Testing UI responsiveness...")
 
         update_intervals = []
-        last_update_time = time.time()
+        last_update_time = time.perf_counter_ns()
 
         def mock_update_callback(*args, **kwargs):
             nonlocal last_update_time
-            current_time = time.time()
-            interval = current_time - last_update_time
+            current_time = time.perf_counter_ns()
+            interval = (current_time - last_update_time) / 1e9
             update_intervals.append(interval)
             last_update_time = current_time
 
@@ -160,11 +212,7 @@ class Phase45PerformanceValidator:
         """Test: Memory optimization < 100MB increase for large file sets."""
         print("Testing memory optimization...")
 
-        import psutil
-        import os
-
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss / (1024 * 1024)  # MB
+        initial_memory = _current_rss_mb()
 
         # Simulate processing large file set
         with patch("email_parser.cli.interactive_file.Console"):
@@ -186,7 +234,7 @@ class Phase45PerformanceValidator:
             discovery_result = converter._generate_recommendations(large_files)
 
             # Measure memory after processing
-            final_memory = process.memory_info().rss / (1024 * 1024)  # MB
+            final_memory = _current_rss_mb()
             memory_increase = final_memory - initial_memory
 
             # Requirement: < 100MB increase
@@ -229,9 +277,9 @@ class Phase45PerformanceValidator:
                 files.append(file_info)
 
             # Time recommendation generation
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             recommendation = profile_manager.recommend_profile(files)
-            recommendation_time = time.time() - start_time
+            recommendation_time = (time.perf_counter_ns() - start_time) / 1e9
 
             recommendation_times[size] = recommendation_time
 
@@ -253,28 +301,46 @@ class Phase45PerformanceValidator:
         """Test: Batch processing UI handles 100 files in < 5 seconds UI time."""
         print("Testing batch processing UI performance...")
 
-        # Mock UI operations timing
-        ui_operations = []
-        start_time = time.time()
+        files = [
+            ConvertibleFile(Path(f"/batch/file_{i}.pdf"), "pdf", 1024 * 1024, 2.0, [])
+            for i in range(100)
+        ]
+        discovery_result = FileDiscoveryResult(
+            total_files=len(files),
+            convertible_files=files,
+            total_size=sum(f.size for f in files),
+            estimated_total_time=sum(f.estimated_conversion_time for f in files),
+            recommendations=[],
+        )
 
-        # Simulate UI operations for 100 files
-        for i in range(100):
-            # Simulate file discovery UI update
-            ui_start = time.time()
-            time.sleep(0.001)  # 1ms UI operation
-            ui_operations.append(time.time() - ui_start)
-
-            # Simulate progress bar update
-            ui_start = time.time()
-            time.sleep(0.002)  # 2ms progress update
-            ui_operations.append(time.time() - ui_start)
-
-            # Simulate status message update
-            ui_start = time.time()
-            time.sleep(0.001)  # 1ms status update
-            ui_operations.append(time.time() - ui_start)
-
-        total_ui_time = time.time() - start_time
+        with patch("email_parser.cli.interactive_file.Console"):
+            converter = InteractiveFileConverter()
+        # Render into an in-memory console so the real rich output is timed
+        # without depending on the terminal
+        converter.console = Console(file=io.StringIO(), width=100)
+
+        ui_operations = []
+        start_time = time.perf_counter_ns()
+
+        # File discovery update
+        ui_start = time.perf_counter_ns()
+        converter._display_discovery_results(discovery_result)
+        ui_operations.append((time.perf_counter_ns() - ui_start) / 1e9)
+
+        with Progress(console=converter.console) as progress:
+            task = progress.add_task("Converting files...", total=len(files))
+            for file in files:
+                # Status message update
+                ui_start = time.perf_counter_ns()
+                converter.console.print(f"Converting: {file.path.name}")
+                ui_operations.append((time.perf_counter_ns() - ui_start) / 1e9)
+
+                # Progress bar update
+                ui_start = time.perf_counter_ns()
+                progress.update(task, advance=1)
+                ui_operations.append((time.perf_counter_ns() - ui_start) / 1e9)
+
+        total_ui_time = (time.perf_counter_ns() - start_time) / 1e9
 
         # Requirement: Handle 100 files in < 5 seconds UI time
         requirement_met = total_ui_time < 5.0
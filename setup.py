@@ -13,16 +13,38 @@ setup(
         "pypdf2>=3.0.0",
         "pillow>=10.0.0",
         "filetype>=1.0.0",
-        "openpyxl>=3.1.0",
-        "pandas>=2.0.0",
         "chardet>=5.0.0",
-        "mistralai>=1.5.2",
-        "mammoth>=1.6.0",
-        "beautifulsoup4>=4.12.0",
-        "lxml>=4.9.0",
-        "tiktoken>=0.5.0",
-        "python-docx>=0.8.11",
         "prompt_toolkit>=3.0.0",
     ],
+    extras_require={
+        "excel": [
+            "openpyxl>=3.1.0",
+            "pandas>=2.0.0",
+        ],
+        "docx": [
+            "mammoth>=1.6.0",
+            "beautifulsoup4>=4.12.0",
+            "lxml>=4.9.0",
+            "python-docx>=0.8.11",
+        ],
+        "ai": [
+            "mistralai>=1.5.2",
+            "tiktoken>=0.5.0",
+        ],
+        "speedups": [
+            "pybase64>=1.3.0",
+        ],
+        "all": [
+            "openpyxl>=3.1.0",
+            "pandas>=2.0.0",
+            "mammoth>=1.6.0",
+            "beautifulsoup4>=4.12.0",
+            "lxml>=4.9.0",
+            "python-docx>=0.8.11",
+            "mistralai>=1.5.2",
+            "tiktoken>=0.5.0",
+            "pybase64>=1.3.0",
+        ],
+    },
     python_requires=">=3.12",
 )
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""Shared pytest configuration for the test suite."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --run-slow is given.
+
+    Skipping at collection time means their fixtures, such as the large
+    benchmark documents, are never built.
+    """
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test - use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="module")
+def mock_console():
+    """Console mock shared by a test module; no test asserts on console calls."""
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def patch_interactive_console(mock_console):
+    """Make every InteractiveFileConverter in the module use ``mock_console``.
+
+    Apply it module-wide with
+    ``pytestmark = pytest.mark.usefixtures("patch_interactive_console")``.
+
+    Only the ``Console`` that ``interactive_file`` binds at import time is
+    patched. Patching ``rich.console.Console`` for a whole module would also
+    replace the console behind ``rich.get_console()``, so Rich prompts could
+    never read a valid answer.
+    """
+    with patch("email_parser.cli.interactive_file.Console", return_value=mock_console):
+        yield mock_console
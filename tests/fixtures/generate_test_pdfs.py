@@ -7,8 +7,9 @@ scenarios including valid PDFs, corrupted files, and edge cases.
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import Callable, List
 
 try:
     from reportlab.pdfgen import canvas
@@ -19,11 +20,10 @@ except ImportError:
     REPORTLAB_AVAILABLE = False
 
 
-def create_simple_pdf(output_path: Path) -> None:
-    """Create a simple single-page PDF with text content."""
-    if not REPORTLAB_AVAILABLE:
-        # Create a minimal PDF manually
-        pdf_content = b"""%PDF-1.4
+# Raw PDF bodies written when ReportLab is unavailable, plus the intentionally
+# malformed fixtures. Kept in one module-level table so each is built once.
+_PDF_BLOBS = {
+    "simple": b"""%PDF-1.4
 1 0 obj
 <<
 /Type /Catalog
@@ -75,23 +75,8 @@ trailer
 >>
 startxref
 323
-%%EOF"""
-        output_path.write_bytes(pdf_content)
-    else:
-        # Use reportlab for better PDF generation
-        c = canvas.Canvas(str(output_path), pagesize=letter)
-        c.drawString(100, 750, "Simple Test PDF")
-        c.drawString(100, 730, "This is a test document for PDF converter testing.")
-        c.drawString(100, 710, "It contains basic text content only.")
-        c.showPage()
-        c.save()
-
-
-def create_multi_page_pdf(output_path: Path) -> None:
-    """Create a multi-page PDF for pagination testing."""
-    if not REPORTLAB_AVAILABLE:
-        # Create a basic multi-page PDF manually
-        pdf_content = b"""%PDF-1.4
+%%EOF""",
+    "multi_page": b"""%PDF-1.4
 1 0 obj
 <<
 /Type /Catalog
@@ -167,34 +152,8 @@ trailer
 >>
 startxref
 510
-%%EOF"""
-        output_path.write_bytes(pdf_content)
-    else:
-        c = canvas.Canvas(str(output_path), pagesize=letter)
-        
-        # Page 1
-        c.drawString(100, 750, "Multi-Page Test PDF - Page 1")
-        c.drawString(100, 730, "This document has multiple pages for testing pagination.")
-        c.showPage()
-        
-        # Page 2
-        c.drawString(100, 750, "Multi-Page Test PDF - Page 2")
-        c.drawString(100, 730, "This is the second page of the test document.")
-        c.showPage()
-        
-        # Page 3
-        c.drawString(100, 750, "Multi-Page Test PDF - Page 3")
-        c.drawString(100, 730, "Final page for comprehensive testing.")
-        c.showPage()
-        
-        c.save()
-
-
-def create_pdf_with_images(output_path: Path) -> None:
-    """Create a PDF with embedded images (placeholder)."""
-    if not REPORTLAB_AVAILABLE:
-        # Simple PDF claiming to have images
-        pdf_content = b"""%PDF-1.4
+%%EOF""",
+    "with_images": b"""%PDF-1.4
 1 0 obj
 <<
 /Type /Catalog
@@ -246,70 +205,8 @@ trailer
 >>
 startxref
 339
-%%EOF"""
-        output_path.write_bytes(pdf_content)
-    else:
-        c = canvas.Canvas(str(output_path), pagesize=letter)
-        c.drawString(100, 750, "PDF with Images Test")
-        c.drawString(100, 730, "This PDF contains embedded images for testing.")
-        c.drawString(100, 710, "[IMAGE PLACEHOLDER - would contain actual image]")
-        c.rect(100, 600, 200, 100)  # Rectangle representing an image
-        c.drawString(100, 580, "Image caption: Test image for OCR")
-        c.showPage()
-        c.save()
-
-
-def create_large_pdf(output_path: Path, target_size_mb: int = 10) -> None:
-    """Create a large PDF file for size testing."""
-    if not REPORTLAB_AVAILABLE:
-        # Create large file by repeating content
-        base_content = b"Large PDF content for testing. " * 1000
-        with open(output_path, "wb") as f:
-            # Write PDF header
-            f.write(b"%PDF-1.4\n")
-            
-            # Write large amount of content to reach target size
-            target_bytes = target_size_mb * 1024 * 1024
-            current_size = len("%PDF-1.4\n")
-            
-            while current_size < target_bytes:
-                f.write(base_content)
-                current_size += len(base_content)
-            
-            # Write PDF footer
-            f.write(b"\n%%EOF\n")
-    else:
-        c = canvas.Canvas(str(output_path), pagesize=letter)
-        
-        # Create many pages with content to reach target size
-        target_bytes = target_size_mb * 1024 * 1024
-        page_count = 0
-        
-        while True:
-            page_count += 1
-            c.drawString(100, 750, f"Large PDF Test - Page {page_count}")
-            
-            # Add lots of text to make file larger
-            y_pos = 730
-            for i in range(50):
-                text = f"Line {i}: This is content to make the PDF file larger for testing purposes. " * 3
-                c.drawString(50, y_pos, text[:80])  # Truncate to fit page
-                y_pos -= 12
-                if y_pos < 50:
-                    break
-            
-            c.showPage()
-            
-            # Check file size approximation
-            if page_count > target_size_mb * 20:  # Rough estimate
-                break
-        
-        c.save()
-
-
-def create_corrupted_pdf(output_path: Path) -> None:
-    """Create a corrupted PDF file for error testing."""
-    corrupted_content = b"""%PDF-1.4
+%%EOF""",
+    "corrupted": b"""%PDF-1.4
 1 0 obj
 <<
 /Type /Catalog
@@ -358,18 +255,8 @@ trailer
 >>
 startxref
 INVALID_STARTXREF
-%%EOF"""
-    output_path.write_bytes(corrupted_content)
-
-
-def create_empty_pdf(output_path: Path) -> None:
-    """Create an empty (zero-byte) PDF file."""
-    output_path.write_bytes(b"")
-
-
-def create_password_protected_pdf(output_path: Path) -> None:
-    """Create a password-protected PDF (simulated)."""
-    protected_content = b"""%PDF-1.4
+%%EOF""",
+    "password_protected": b"""%PDF-1.4
 1 0 obj
 <<
 /Type /Catalog
@@ -432,28 +319,8 @@ trailer
 >>
 startxref
 523
-%%EOF"""
-    output_path.write_bytes(protected_content)
-
-
-def create_fake_pdf(output_path: Path) -> None:
-    """Create a text file with .pdf extension."""
-    fake_content = """This is not a PDF file!
-It's just a plain text file with a .pdf extension.
-This should be detected as invalid by the PDF validator.
-
-Some additional content to make it look like it might be a document:
-- Item 1
-- Item 2  
-- Item 3
-
-But it's definitely not a PDF format."""
-    output_path.write_text(fake_content)
-
-
-def create_unsupported_version_pdf(output_path: Path) -> None:
-    """Create a PDF with unsupported version."""
-    unsupported_content = b"""%PDF-3.0
+%%EOF""",
+    "unsupported_version": b"""%PDF-3.0
 1 0 obj
 <<
 /Type /Catalog
@@ -505,8 +372,154 @@ trailer
 >>
 startxref
 349
-%%EOF"""
-    output_path.write_bytes(unsupported_content)
+%%EOF""",
+}
+
+
+def create_simple_pdf(output_path: Path) -> None:
+    """Create a simple single-page PDF with text content."""
+    if not REPORTLAB_AVAILABLE:
+        # Create a minimal PDF manually
+        output_path.write_bytes(_PDF_BLOBS["simple"])
+    else:
+        # Use reportlab for better PDF generation
+        c = canvas.Canvas(str(output_path), pagesize=letter)
+        c.drawString(100, 750, "Simple Test PDF")
+        c.drawString(100, 730, "This is a test document for PDF converter testing.")
+        c.drawString(100, 710, "It contains basic text content only.")
+        c.showPage()
+        c.save()
+
+
+def create_multi_page_pdf(output_path: Path) -> None:
+    """Create a multi-page PDF for pagination testing."""
+    if not REPORTLAB_AVAILABLE:
+        # Create a basic multi-page PDF manually
+        output_path.write_bytes(_PDF_BLOBS["multi_page"])
+    else:
+        c = canvas.Canvas(str(output_path), pagesize=letter)
+        
+        # Page 1
+        c.drawString(100, 750, "Multi-Page Test PDF - Page 1")
+        c.drawString(100, 730, "This document has multiple pages for testing pagination.")
+        c.showPage()
+        
+        # Page 2
+        c.drawString(100, 750, "Multi-Page Test PDF - Page 2")
+        c.drawString(100, 730, "This is the second page of the test document.")
+        c.showPage()
+        
+        # Page 3
+        c.drawString(100, 750, "Multi-Page Test PDF - Page 3")
+        c.drawString(100, 730, "Final page for comprehensive testing.")
+        c.showPage()
+        
+        c.save()
+
+
+def create_pdf_with_images(output_path: Path) -> None:
+    """Create a PDF with embedded images (placeholder)."""
+    if not REPORTLAB_AVAILABLE:
+        # Simple PDF claiming to have images
+        output_path.write_bytes(_PDF_BLOBS["with_images"])
+    else:
+        c = canvas.Canvas(str(output_path), pagesize=letter)
+        c.drawString(100, 750, "PDF with Images Test")
+        c.drawString(100, 730, "This PDF contains embedded images for testing.")
+        c.drawString(100, 710, "[IMAGE PLACEHOLDER - would contain actual image]")
+        c.rect(100, 600, 200, 100)  # Rectangle representing an image
+        c.drawString(100, 580, "Image caption: Test image for OCR")
+        c.showPage()
+        c.save()
+
+
+def create_large_pdf(output_path: Path, target_size_mb: int = 10) -> None:
+    """Create a large PDF file for size testing."""
+    if not REPORTLAB_AVAILABLE:
+        # Create large file by repeating content
+        base_content = b"Large PDF content for testing. " * 1000
+        with open(output_path, "wb") as f:
+            # Write PDF header
+            f.write(b"%PDF-1.4\n")
+            
+            # Write large amount of content to reach target size
+            target_bytes = target_size_mb * 1024 * 1024
+            current_size = len("%PDF-1.4\n")
+            
+            while current_size < target_bytes:
+                f.write(base_content)
+                current_size += len(base_content)
+            
+            # Write PDF footer
+            f.write(b"\n%%EOF\n")
+    else:
+        c = canvas.Canvas(str(output_path), pagesize=letter)
+        
+        # Create many pages with content to reach target size
+        target_bytes = target_size_mb * 1024 * 1024
+        page_count = 0
+        
+        while True:
+            page_count += 1
+            c.drawString(100, 750, f"Large PDF Test - Page {page_count}")
+            
+            # Add lots of text to make file larger
+            y_pos = 730
+            for i in range(50):
+                text = f"Line {i}: This is content to make the PDF file larger for testing purposes. " * 3
+                c.drawString(50, y_pos, text[:80])  # Truncate to fit page
+                y_pos -= 12
+                if y_pos < 50:
+                    break
+            
+            c.showPage()
+            
+            # Check file size approximation
+            if page_count > target_size_mb * 20:  # Rough estimate
+                break
+        
+        c.save()
+
+
+def create_corrupted_pdf(output_path: Path) -> None:
+    """Create a corrupted PDF file for error testing."""
+    output_path.write_bytes(_PDF_BLOBS["corrupted"])
+
+
+def create_empty_pdf(output_path: Path) -> None:
+    """Create an empty (zero-byte) PDF file."""
+    output_path.write_bytes(b"")
+
+
+def create_password_protected_pdf(output_path: Path) -> None:
+    """Create a password-protected PDF (simulated)."""
+    output_path.write_bytes(_PDF_BLOBS["password_protected"])
+
+
+def create_fake_pdf(output_path: Path) -> None:
+    """Create a text file with .pdf extension."""
+    fake_content = """This is not a PDF file!
+It's just a plain text file with a .pdf extension.
+This should be detected as invalid by the PDF validator.
+
+Some additional content to make it look like it might be a document:
+- Item 1
+- Item 2  
+- Item 3
+
+But it's definitely not a PDF format."""
+    output_path.write_text(fake_content)
+
+
+def create_unsupported_version_pdf(output_path: Path) -> None:
+    """Create a PDF with unsupported version."""
+    output_path.write_bytes(_PDF_BLOBS["unsupported_version"])
+
+
+def _create_fixture(create_func: Callable[[Path], None], output_path: Path) -> int:
+    """Run a fixture generator in a worker process and return the file size."""
+    create_func(output_path)
+    return output_path.stat().st_size
 
 
 def main():
@@ -531,14 +544,19 @@ def main():
         ("unsupported_version.pdf", create_unsupported_version_pdf),
     ]
     
-    for filename, create_func in test_files:
-        file_path = fixtures_dir / filename
-        try:
-            create_func(file_path)
-            file_size = file_path.stat().st_size
-            print(f"Created {filename} ({file_size} bytes)")
-        except Exception as e:
-            print(f"Error creating {filename}: {e}")
+    # Each fixture is independent, so generate them across worker processes
+    with ProcessPoolExecutor() as pool:
+        futures = {
+            pool.submit(_create_fixture, create_func, fixtures_dir / filename): filename
+            for filename, create_func in test_files
+        }
+        for future in as_completed(futures):
+            filename = futures[future]
+            try:
+                file_size = future.result()
+                print(f"Created {filename} ({file_size} bytes)")
+            except Exception as e:
+                print(f"Error creating {filename}: {e}")
     
     # Create large file separately (optional)
     large_file = fixtures_dir / "large_10mb.pdf"
@@ -0,0 +1,23 @@
+"""Shared configuration for integration tests."""
+
+import os
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests that need a live MistralAI key when none is configured.
+
+    A test is live when it requests the ``api_key`` fixture or is marked
+    ``live`` (for tests that hit the real API without a valid key).
+
+    Deciding this once at collection time avoids building fixtures and
+    evaluating per-test skip conditions for every live API test.
+    """
+    if os.getenv("MISTRALAI_API_KEY"):
+        return
+
+    skip_live = pytest.mark.skip(reason="MISTRALAI_API_KEY not set - skipping live API tests")
+    for item in items:
+        if "api_key" in getattr(item, "fixturenames", ()) or item.get_closest_marker("live"):
+            item.add_marker(skip_live)
@@ -2,198 +2,142 @@
 Integration tests for the email processor.
 """
 
-import os
-import shutil
-import unittest
-from typing import cast, List, Union, BinaryIO
-from unittest.mock import patch, MagicMock
+from pathlib import Path
+from typing import List, Union, BinaryIO
+from unittest.mock import Mock
+
+import pytest
 
 from email_parser.core.email_processor import EmailProcessor
 from email_parser.exceptions.parsing_exceptions import EmailParsingError
 from email_parser.core.config import ProcessingConfig
 
+SAMPLE_EMAIL_BYTES = (
+    b'From: sender@example.com\nTo: recipient@example.com\nSubject: Test Email\nContent-Type: multipart/mixed; boundary="boundary"\n\n--boundary\nContent-Type: text/plain\n\nThis is an integration test email.\n\n--boundary\nContent-Type: text/html\n\n<html><body><p>This is an integration test email.</p></body></html>\n\n--boundary\nContent-Type: application/octet-stream\nContent-Disposition: attachment; filename="test.txt"\nContent-Transfer-Encoding: base64\n\nVGhpcyBpcyBhIHRlc3QgYXR0YWNobWVudC4=\n\n--boundary--\n'
+)
 
-class TestEmailProcessor(unittest.TestCase):
-    """Integration tests for the EmailProcessor class."""
-
-    #     def setUp(self):
-    #         """Set up test fixtures."""
-    #         self.test_output_dir = "test_output"
-
-    #         # Create test output directory
-    #         os.makedirs(self.test_output_dir, exist_ok=True)
-
-    #         # Test data directory
-    #         self.test_data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test_data", "sample_emails")
-    #         os.makedirs(self.test_data_dir, exist_ok=True)
-
-    #         # Create a simple test email file
-    #         self.test_email_path = os.path.join(self.test_data_dir, "test_email.eml")
-    #         with open(self.test_email_path, "wb") as f:
-    #             f.write(b"""From: sender@example.com
-    # To: recipient@example.com
-    # Subject: Test Email
-    # Content-Type: multipart/mixed; boundary="boundary"
-
-    # --boundary
-    # Content-Type: text/plain; charset="utf-8"
-    # Content-Transfer-Encoding: 7bit
 
-    # This is an integration test email.
+@pytest.fixture(scope="module")
+def output_dir(tmp_path_factory) -> Path:
+    """Output directory shared by the module-scoped processor."""
+    return tmp_path_factory.mktemp("email_processor")
 
-    # --boundary
-    # Content-Type: text/html; charset="utf-8"
-    # Content-Transfer-Encoding: 7bit
 
-    # <html><body><p>This is an integration test email.</p></body></html>
-
-    # --boundary
-    # Content-Type: application/octet-stream
-    # Content-Disposition: attachment; filename="test.txt"
-    # Content-Transfer-Encoding: base64
-
-    # VGhpcyBpcyBhIHRlc3QgYXR0YWNobWVudC4=
-
-    # --boundary--
-    # """)
-
-    #         # Create a test Excel file for conversion testing
-    #         self.test_excel_path = os.path.join(self.test_data_dir, "test_excel.eml")
-
-    #         # Mock Excel file creation would go here in a real test
-
-    #         # Initialize processor
-    #         self.processor = EmailProcessor(
-    #             output_dir=self.test_output_dir,
-    #             enable_excel_conversion=True
-    #         )
-    # tests/integration/test_email_processor.py
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        # Use temporary directory instead of OneDrive location
-        self.test_output_dir = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "temp_test_output"
+@pytest.fixture(scope="module")
+def processor(output_dir: Path) -> EmailProcessor:
+    """Build one EmailProcessor for the module; tests use distinct email IDs."""
+    return EmailProcessor(
+        config=ProcessingConfig(
+            output_directory=str(output_dir),
+            convert_excel=False,
+            convert_pdf=False,
+            convert_docx=False,
         )
+    )
 
-        # Create test output directory
-        os.makedirs(self.test_output_dir, exist_ok=True)
-
-        # Test data directory - change to temp location
-        self.test_data_dir = os.path.join(self.test_output_dir, "sample_emails")
-        os.makedirs(self.test_data_dir, exist_ok=True)
 
-        # Create a simple test email file
-        self.test_email_path = os.path.join(self.test_data_dir, "test_email.eml")
-        with open(self.test_email_path, "wb") as f:
-            # Original content here...
-            f.write(
-                b'From: sender@example.com\nTo: recipient@example.com\nSubject: Test Email\nContent-Type: multipart/mixed; boundary="boundary"\n\n--boundary\nContent-Type: text/plain\n\nThis is an integration test email.\n\n--boundary\nContent-Type: text/html\n\n<html><body><p>This is an integration test email.</p></body></html>\n\n--boundary\nContent-Type: application/octet-stream\nContent-Disposition: attachment; filename="test.txt"\nContent-Transfer-Encoding: base64\n\nVGhpcyBpcyBhIHRlc3QgYXR0YWNobWVudC4=\n\n--boundary--\n'
-            )
-
-        # Initialize processor
-        self.processor = EmailProcessor(
-            config=ProcessingConfig(output_directory=self.test_output_dir, convert_excel=False)
-        )
-
-    def tearDown(self) -> None:
-        """Clean up after tests."""
-        # Remove test directories
-        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+class TestEmailProcessor:
+    """Integration tests for the EmailProcessor class."""
 
-    def test_process_email(self) -> None:
+    def test_process_email(self, processor: EmailProcessor, output_dir: Path) -> None:
         """Test end-to-end email processing."""
-        with open(self.test_email_path, "rb") as f:
-            email_content = f.read()
-
-        result = self.processor.process_email(email_content, "test_integration_email")
+        result = processor.process_email(SAMPLE_EMAIL_BYTES, "test_integration_email")
 
         # Check result structure
-        self.assertEqual(result["email_id"], "test_integration_email")
-        self.assertIn("timestamp", result)
-        self.assertEqual(result["headers"]["From"], "sender@example.com")
-        self.assertEqual(result["headers"]["To"], "recipient@example.com")
-        self.assertEqual(result["headers"]["Subject"], "Test Email")
+        assert result["email_id"] == "test_integration_email"
+        assert "timestamp" in result
+        assert result["headers"]["From"] == "sender@example.com"
+        assert result["headers"]["To"] == "recipient@example.com"
+        assert result["headers"]["Subject"] == "Test Email"
 
         # Check components were extracted
-        self.assertEqual(len(result["text_files"]), 2)
-        self.assertEqual(len(result["attachments"]), 1)
+        assert len(result["text_files"]) == 2
+        assert len(result["attachments"]) == 1
 
         # Check output directory structure
-        text_dir = os.path.join(self.test_output_dir, "processed_text")
-        attachments_dir = os.path.join(self.test_output_dir, "attachments")
-
-        self.assertTrue(os.path.exists(text_dir))
-        self.assertTrue(os.path.exists(attachments_dir))
+        assert (output_dir / "processed_text").is_dir()
+        assert (output_dir / "attachments").is_dir()
 
         # Check text file content
         for text_file in result["text_files"]:
-            self.assertTrue(os.path.exists(text_file["path"]))
-            with open(text_file["path"], "r", encoding="utf-8") as text_file_handle:
-                content = text_file_handle.read()
-                if text_file["type"] == "plain":
-                    self.assertIn("This is an integration test email", content)
-                else:
-                    self.assertIn("<p>This is an integration test email.</p>", content)
+            text_path = Path(text_file["path"])
+            assert text_path.exists()
+            content = text_path.read_text(encoding="utf-8")
+            if text_file["type"] == "plain":
+                assert "This is an integration test email" in content
+            else:
+                assert "<p>This is an integration test email.</p>" in content
 
         # Check attachment content
         for attachment in result["attachments"]:
-            self.assertTrue(os.path.exists(attachment["path"]))
-            with open(attachment["path"], "rb") as f:
-                content = f.read()
-                self.assertEqual(content, b"This is a test attachment.")
+            attachment_path = Path(attachment["path"])
+            assert attachment_path.exists()
+            assert attachment_path.read_bytes() == b"This is a test attachment."
 
-        # Check metadata file
-        metadata_files = [f for f in os.listdir(self.test_output_dir) if f.startswith("metadata_")]
-        self.assertEqual(len(metadata_files), 1)
+        # Check metadata file (the output directory is shared, so match on email ID)
+        metadata_files = list(output_dir.glob("metadata_test_integration_email_*"))
+        assert len(metadata_files) == 1
 
-    def test_process_email_file_path(self) -> None:
+    def test_process_email_file_path(self, processor: EmailProcessor, tmp_path: Path) -> None:
         """Test processing an email from a file path."""
-        result = self.processor.process_email(self.test_email_path, "test_file_path")
+        test_email_path = tmp_path / "test_email.eml"
+        test_email_path.write_bytes(SAMPLE_EMAIL_BYTES)
+
+        result = processor.process_email(str(test_email_path), "test_file_path")
 
         # Check result structure
-        self.assertEqual(result["email_id"], "test_file_path")
-        self.assertIn("timestamp", result)
+        assert result["email_id"] == "test_file_path"
+        assert "timestamp" in result
 
         # Check components were extracted
-        self.assertEqual(len(result["text_files"]), 2)
-        self.assertEqual(len(result["attachments"]), 1)
+        assert len(result["text_files"]) == 2
+        assert len(result["attachments"]) == 1
 
-    def test_process_email_batch(self) -> None:
+    def test_process_email_batch(self, processor: EmailProcessor) -> None:
         """Test batch processing of emails."""
-        # Create a second test email
-        second_email_path = os.path.join(self.test_data_dir, "second_email.eml")
-        shutil.copy(self.test_email_path, second_email_path)
-
         # Process batch
-        email_paths = [self.test_email_path, second_email_path]
         email_ids = ["email1", "email2"]
+        email_contents: List[Union[bytes, BinaryIO, str]] = [SAMPLE_EMAIL_BYTES, SAMPLE_EMAIL_BYTES]
 
-        # Read email contents as bytes
-        email_contents: List[Union[bytes, BinaryIO, str]] = []
-        for path in email_paths:
-            with open(path, "rb") as f:
-                email_contents.append(f.read())
-
-        batch_result = self.processor.process_email_batch(email_contents, email_ids)
+        batch_result = processor.process_email_batch(email_contents, email_ids)
 
         # Check batch result
-        self.assertEqual(batch_result["total"], 2)
-        self.assertEqual(batch_result["success_count"], 2)
-        self.assertEqual(batch_result["error_count"], 0)
+        assert batch_result["total"] == 2
+        assert batch_result["success_count"] == 2
+        assert batch_result["error_count"] == 0
 
         # Check successful results
-        self.assertEqual(len(batch_result["successful"]), 2)
-        self.assertEqual(batch_result["successful"][0]["email_id"], "email1")
-        self.assertEqual(batch_result["successful"][1]["email_id"], "email2")
+        assert len(batch_result["successful"]) == 2
+        assert batch_result["successful"][0]["email_id"] == "email1"
+        assert batch_result["successful"][1]["email_id"] == "email2"
 
-    def test_process_email_error(self) -> None:
+    def test_process_email_error(
+        self, processor: EmailProcessor, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test handling of processing errors."""
-        with patch("email_parser.core.mime_parser.MIMEParser.parse_email") as mock_parse:
-            mock_parse.side_effect = Exception("Test parsing error")
-
-            with self.assertRaises(EmailParsingError):
-                self.processor.process_email(b"Invalid email content", "error_email")
-
+        mock_parse = Mock(side_effect=Exception("Test parsing error"))
+        monkeypatch.setattr("email_parser.core.mime_parser.MIMEParser.parse_email", mock_parse)
+
+        with pytest.raises(EmailParsingError):
+            processor.process_email(b"Invalid email content", "error_email")
+
+    def test_missing_converter_extras_disable_conversion(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that Excel/PDF/DOCX conversion is skipped when their extras are not installed."""
+        monkeypatch.setattr("email_parser.core.email_processor.EXCEL_AVAILABLE", False)
+        monkeypatch.setattr("email_parser.core.email_processor.MISTRAL_AVAILABLE", False)
+        monkeypatch.setattr("email_parser.core.email_processor.DOCX_AVAILABLE", False)
+
+        processor = EmailProcessor(
+            config=ProcessingConfig(
+                output_directory=str(tmp_path),
+                convert_excel=True,
+                convert_pdf=True,
+                convert_docx=True,
+            )
+        )
 
-if __name__ == "__main__":
-    unittest.main()
+        assert processor.enable_excel_conversion is False
+        assert processor.enable_pdf_conversion is False
+        assert processor.enable_docx_conversion is False
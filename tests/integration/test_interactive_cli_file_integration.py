@@ -6,9 +6,11 @@ Tests the complete workflow integration between main CLI and file conversion mod
 """
 
 import asyncio
-import tempfile
+import os
+from contextlib import ExitStack, nullcontext
+from operator import attrgetter
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import DEFAULT, AsyncMock, Mock, patch
 
 import pytest
 
@@ -19,33 +21,85 @@ from email_parser.cli.interactive_file import (
     FileConversionProfileManager,
     InteractiveFileConverter,
 )
-from email_parser.cli.file_converter import DirectFileConverter, ConversionResult
+from email_parser.cli.file_converter import ConversionResult
 
+pytestmark = pytest.mark.usefixtures("patch_interactive_console")
 
-class TestInteractiveCLIFileIntegration:
-    """Test integration between InteractiveCLI and InteractiveFileConverter."""
+# Directory, profile and output answers for a directory conversion of the cwd
+_DIR_PROMPT_SEQ = (".", "ai_processing", "output")
+
+
+def _seed_workspace(workspace: Path) -> Path:
+    """Create empty sample PDF, DOCX and XLSX files in ``workspace``.
+
+    Type detection goes by extension and conversion is mocked, so the files
+    need no content.
+    """
+    for name in ("document.pdf", "report.docx", "data.xlsx"):
+        (workspace / name).touch()
+    return workspace
+
+
+def _make_result(**overrides) -> Mock:
+    """Build a successful ``ConversionResult`` mock; keyword arguments override fields."""
+    fields = {
+        "success": True,
+        "output_path": Path("output/converted.md"),
+        "duration_seconds": 2.0,
+        "error_message": None,
+        "metadata": {},
+    }
+    fields.update(overrides)
+    return Mock(spec=ConversionResult, **fields)
+
+
+def _make_convertible(path: Path, **overrides) -> ConvertibleFile:
+    """Build a small PDF ``ConvertibleFile``; keyword arguments override fields."""
+    fields = {
+        "file_type": "pdf",
+        "size": 1024,
+        "estimated_conversion_time": 1.0,
+        "complexity_indicators": [],
+    }
+    fields.update(overrides)
+    return ConvertibleFile(path=path, **fields)
+
+
+@pytest.fixture(scope="module")
+def workspace(tmp_path_factory):
+    """Read-only directory of sample files, seeded once per module."""
+    return _seed_workspace(tmp_path_factory.mktemp("workspace"))
+
+
+@pytest.fixture(scope="module")
+def shared_converter():
+    """One InteractiveFileConverter for the module.
+
+    Tests patch its collaborators with ``monkeypatch`` or ``patch.object`` so the
+    changes unwind after each test.
+    """
+    return InteractiveFileConverter()
 
-    @pytest.fixture
-    def temp_workspace(self):
-        """Create temporary workspace for testing."""
-        temp_dir = Path(tempfile.mkdtemp())
 
-        # Create sample files
-        pdf_file = temp_dir / "document.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4 sample content")
+@pytest.fixture(scope="module")
+def shared_cli():
+    """One InteractiveCLI for the module; tests reset what they touch per test.
 
-        docx_file = temp_dir / "report.docx"
-        docx_file.write_bytes(b"PK\x03\x04 docx content")
+    ``InteractiveCLI`` imports its console lazily from ``rich.console``, so that
+    name is patched only while the CLI is built.
+    """
+    with patch("rich.console.Console"):
+        return InteractiveCLI()
 
-        xlsx_file = temp_dir / "data.xlsx"
-        xlsx_file.write_bytes(b"PK\x03\x04 xlsx content")
 
-        yield temp_dir
+@pytest.fixture(scope="module")
+def profile_manager():
+    """One FileConversionProfileManager for the module; tests only read profiles."""
+    return FileConversionProfileManager()
 
-        # Cleanup
-        import shutil
 
-        shutil.rmtree(temp_dir, ignore_errors=True)
+class TestInteractiveCLIFileIntegration:
+    """Test integration between InteractiveCLI and InteractiveFileConverter."""
 
     @pytest.fixture
     def mock_prompt_responses(self):
@@ -61,119 +115,127 @@ class TestInteractiveCLIFileIntegration:
             "back_to_main": "back",
         }
 
-    @pytest.mark.asyncio
-    async def test_main_menu_to_file_conversion(self):
+    def test_main_menu_to_file_conversion(self):
         """Test navigation from main menu to file conversion mode."""
-        with patch("rich.console.Console") as mock_console:
-            cli = InteractiveCLI()
-
-            # Test navigation context
-            assert cli.navigation.get_path() == "Main Menu"
-
-            # Mock file converter
-            mock_file_converter = AsyncMock()
-            cli.file_converter = mock_file_converter
-
-            # Mock main menu selection
-            with patch("email_parser.cli.interactive.Prompt.ask", return_value="3"):
-                # This would normally trigger file conversion mode
-                cli.navigation.push("Convert Documents")
-
-            assert cli.navigation.get_path() == "Main Menu > Convert Documents"
-
-    @pytest.mark.asyncio
-    async def test_complete_file_conversion_workflow(self, temp_workspace):
-        """Test complete workflow from menu selection to conversion completion."""
-        with patch("email_parser.cli.interactive_file.Console") as mock_console:
-            converter = InteractiveFileConverter()
-
-            # Mock user inputs
-            with patch("email_parser.cli.interactive_file.Prompt.ask") as mock_prompt:
-                with patch("email_parser.cli.interactive_file.Confirm.ask") as mock_confirm:
-                    mock_prompt.side_effect = [
-                        "directory",  # Choose directory conversion
-                        str(temp_workspace),  # Directory path
-                        "ai_processing",  # Profile selection
-                        "output",  # Output directory
-                    ]
-                    mock_confirm.side_effect = [
-                        True,  # Proceed with conversion
-                        False,  # Skip quality analysis
-                    ]
-
-                    # Mock DirectFileConverter
-                    with patch.object(converter, "direct_converter") as mock_direct:
-                        mock_result = Mock()
-                        mock_result.success = True
-                        mock_result.output_path = Path("output/converted.md")
-                        mock_result.duration_seconds = 2.0
-                        mock_result.error_message = None
-                        mock_result.metadata = {}
-
-                        mock_direct.convert_file.return_value = mock_result
-
-                        # Execute directory conversion
-                        await converter._directory_conversion()
-
-    @pytest.mark.asyncio
-    async def test_error_recovery_workflow(self, temp_workspace):
-        """Test error recovery and navigation during conversion failures."""
-        converter = InteractiveFileConverter()
+        cli = InteractiveCLI()
+
+        # Test navigation context
+        assert cli.navigation.get_path() == "Main Menu"
 
+        # Mock file converter, recording the breadcrumb it runs under
+        paths = []
+        mock_file_converter = Mock()
+        mock_file_converter.run_file_mode = AsyncMock(
+            side_effect=lambda: paths.append(cli.navigation.get_path())
+        )
+        cli.file_converter = mock_file_converter
+
+        # The main menu reads its choice with input()
+        with patch("builtins.input", return_value="3"):
+            action = cli._show_main_menu()
+
+        assert action == "convert_documents"
+
+        cli._convert_documents()
+
+        mock_file_converter.run_file_mode.assert_awaited_once()
+        assert mock_file_converter.parent_cli is cli
+        assert paths == ["Main Menu > Document Conversion"]
+        assert cli.navigation.get_path() == "Main Menu"
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_complete_file_conversion_workflow(
+        self, shared_converter, workspace, tmp_path
+    ):
+        """Test complete workflow from directory prompt to conversion completion."""
+        output_dir = tmp_path / "output"
+
+        with patch(
+            "email_parser.cli.interactive_file.DirectFileConverter"
+        ) as mock_class, patch.multiple(
+            "email_parser.cli.interactive_file", Prompt=DEFAULT, Confirm=DEFAULT
+        ) as mocks, patch(
+            "email_parser.cli.interactive_file.Progress"
+        ), patch.object(
+            shared_converter.console, "print"
+        ) as mock_print:
+            mock_converter = mock_class.return_value
+            mock_converter.convert_file.return_value = _make_result()
+
+            mocks["Prompt"].ask.side_effect = [
+                str(workspace),  # Directory path
+                "ai_processing",  # Profile selection
+                str(output_dir),  # Output directory
+            ]
+            mocks["Confirm"].ask.side_effect = [
+                True,  # Proceed with conversion
+                False,  # Skip quality analysis
+            ]
+
+            await shared_converter._directory_conversion()
+
+        # Every discovered file goes through the converter into output_dir
+        assert mock_converter.convert_file.call_count == 3
+        converted = {call.args[0].name for call in mock_converter.convert_file.call_args_list}
+        assert converted == {"document.pdf", "report.docx", "data.xlsx"}
+        for call in mock_converter.convert_file.call_args_list:
+            assert call.args[1] == output_dir
+        for call in mock_class.call_args_list:
+            assert call.kwargs["output_directory"] == str(output_dir)
+
+        mock_print.assert_any_call("✅ Successfully converted: 3 files")
+        assert mocks["Confirm"].ask.call_count == 2
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_error_recovery_workflow(self, shared_converter, tmp_path):
+        """Test error recovery and navigation during conversion failures."""
         # Create a file that will fail conversion
-        problem_file = temp_workspace / "corrupted.pdf"
-        problem_file.write_bytes(b"Not a valid PDF")
+        problem_file = tmp_path / "corrupted.pdf"
+        problem_file.touch()
 
-        files = [
-            ConvertibleFile(
-                path=problem_file,
-                file_type="pdf",
-                size=100,
-                estimated_conversion_time=1.0,
-                complexity_indicators=["corrupted"],
-            )
-        ]
+        files = [_make_convertible(problem_file, size=100, complexity_indicators=["corrupted"])]
 
         profile = ConversionProfile(
             name="Test", description="Test", settings={"convert_pdf": True}, recommended_for=[]
         )
 
-        # Mock conversion to fail
-        with patch.object(converter, "_convert_with_profile") as mock_convert:
+        with ExitStack() as stack:
+            # Mock conversion to fail
+            mock_convert = stack.enter_context(
+                patch.object(shared_converter, "_convert_with_profile")
+            )
             mock_convert.return_value = {
                 "success": False,
                 "error": "Invalid PDF format",
                 "duration": 0.0,
             }
 
-            # Mock error handler to suggest retry
-            with patch.object(converter.error_handler, "handle_error") as mock_error_handler:
-                mock_error_handler.return_value = False  # Don't retry
+            # Mock error handler to decline retry
+            mock_error_handler = stack.enter_context(
+                patch.object(shared_converter.error_handler, "handle_error", return_value=False)
+            )
 
-                # Mock console and user inputs
-                with patch.object(converter.console, "print"):
-                    with patch("email_parser.cli.interactive_file.Confirm.ask", return_value=False):
-                        await converter._perform_conversion(
-                            files, profile, temp_workspace / "output"
-                        )
+            # Mock console and user inputs
+            stack.enter_context(patch.object(shared_converter.console, "print"))
+            stack.enter_context(
+                patch("email_parser.cli.interactive_file.Confirm.ask", return_value=False)
+            )
+
+            await shared_converter._perform_conversion(files, profile, tmp_path / "output")
 
-                # Verify error handling was called
-                assert mock_error_handler.called
+        # Verify error handling was called
+        assert mock_error_handler.called
 
-    @pytest.mark.asyncio
-    async def test_profile_switching_mid_workflow(self):
+    def test_profile_switching_mid_workflow(self, profile_manager):
         """Test changing profiles during conversion workflow."""
-        converter = InteractiveFileConverter()
-        profile_manager = FileConversionProfileManager()
 
         # Get all available profiles
         profiles = profile_manager.get_profiles()
 
         # Test switching between profiles
         files = [
-            ConvertibleFile(
-                path=Path("/test/doc.pdf"),
-                file_type="pdf",
+            _make_convertible(
+                Path("/test/doc.pdf"),
                 size=10 * 1024 * 1024,
                 estimated_conversion_time=5.0,
                 complexity_indicators=["large"],
@@ -193,49 +255,50 @@ class TestInteractiveCLIFileIntegration:
         assert initial_recommendation in profiles
         assert new_recommendation in profiles
 
-    @pytest.mark.asyncio
-    async def test_cancellation_at_various_steps(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(
+        "prompts, expectation",
+        [
+            # Back out at directory selection; should exit without proceeding
+            pytest.param(("back",), nullcontext(), id="directory_selection"),
+            # Interrupt at profile selection
+            pytest.param(
+                (".", KeyboardInterrupt()),
+                pytest.raises(KeyboardInterrupt),
+                id="profile_selection",
+            ),
+            # Decline at conversion confirmation; should not convert anything
+            pytest.param(_DIR_PROMPT_SEQ, nullcontext(), id="conversion_confirmation"),
+        ],
+    )
+    async def test_cancellation_at_various_steps(self, shared_converter, prompts, expectation):
         """Test user cancellation at different workflow steps."""
-        converter = InteractiveFileConverter()
-
-        # Test 1: Cancel at directory selection
-        with patch("email_parser.cli.interactive_file.Prompt.ask", return_value="back"):
-            # Should exit without proceeding
-            await converter._directory_conversion()
+        with patch.multiple(
+            "email_parser.cli.interactive_file", Prompt=DEFAULT, Confirm=DEFAULT
+        ) as mocks:
+            mocks["Prompt"].ask.side_effect = prompts
+            mocks["Confirm"].ask.return_value = False
 
-        # Test 2: Cancel at profile selection
-        with patch("email_parser.cli.interactive_file.Prompt.ask") as mock_prompt:
-            mock_prompt.side_effect = [".", KeyboardInterrupt()]
+            with expectation:
+                await shared_converter._directory_conversion()
 
-            with pytest.raises(KeyboardInterrupt):
-                await converter._directory_conversion()
-
-        # Test 3: Cancel at conversion confirmation
-        with patch("email_parser.cli.interactive_file.Prompt.ask") as mock_prompt:
-            with patch("email_parser.cli.interactive_file.Confirm.ask", return_value=False):
-                mock_prompt.side_effect = [".", "ai_processing", "output"]
-
-                # Should complete without performing conversion
-                await converter._directory_conversion()
-
-    @pytest.mark.asyncio
-    async def test_batch_processing_with_progress(self, temp_workspace):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_batch_processing_with_progress(self, shared_converter, tmp_path):
         """Test batch file processing with progress tracking."""
-        converter = InteractiveFileConverter()
-
-        # Create multiple files
+        # Create one file and hard-link the rest to it
+        master = tmp_path / "document_0.pdf"
+        master.touch()
         files = []
         for i in range(5):
-            file_path = temp_workspace / f"document_{i}.pdf"
-            file_path.write_bytes(b"%PDF-1.4 content")
+            file_path = tmp_path / f"document_{i}.pdf"
+            if i:
+                try:
+                    os.link(master, file_path)
+                except OSError:
+                    # Filesystems without hard links
+                    file_path.touch()
             files.append(
-                ConvertibleFile(
-                    path=file_path,
-                    file_type="pdf",
-                    size=1024 * 1024,
-                    estimated_conversion_time=2.0,
-                    complexity_indicators=[],
-                )
+                _make_convertible(file_path, size=1024 * 1024, estimated_conversion_time=2.0)
             )
 
         profile = ConversionProfile(
@@ -246,7 +309,7 @@ class TestInteractiveCLIFileIntegration:
         )
 
         # Mock successful conversions
-        with patch.object(converter, "_convert_with_profile") as mock_convert:
+        with patch.object(shared_converter, "_convert_with_profile") as mock_convert:
             mock_convert.return_value = {
                 "success": True,
                 "output_path": "output/converted.md",
@@ -256,12 +319,12 @@ class TestInteractiveCLIFileIntegration:
 
             # Mock progress display
             with patch("email_parser.cli.interactive_file.Progress"):
-                with patch.object(converter.console, "print"):
+                with patch.object(shared_converter.console, "print"):
                     with patch(
                         "email_parser.cli.interactive_file.Confirm.ask", return_value=False
                     ):
-                        await converter._perform_conversion(
-                            files, profile, temp_workspace / "output"
+                        await shared_converter._perform_conversion(
+                            files, profile, tmp_path / "output"
                         )
 
             # Verify all files were processed
@@ -271,219 +334,188 @@ class TestInteractiveCLIFileIntegration:
 class TestProfileConverterMapping:
     """Test profile to converter configuration mapping."""
 
-    @pytest.fixture
-    def converter(self):
-        """Create converter instance."""
-        with patch("email_parser.cli.interactive_file.Console"):
-            return InteractiveFileConverter()
-
-    def test_ai_processing_profile_mapping(self, converter):
-        """Test AI Processing profile maps correctly to converter settings."""
-        profile_manager = FileConversionProfileManager()
-        ai_profile = profile_manager.get_profile("ai_processing")
-
-        config = converter._map_profile_to_config(ai_profile.settings, "/output")
-
-        # Verify PDF settings
-        assert config.convert_pdf is True
-        assert config.pdf_extraction_mode == "all"
-
-        # Verify DOCX settings
-        assert config.convert_docx is True
-        assert config.docx_conversion.enabled is True
-        assert config.docx_conversion.enable_chunking is True
-        assert config.docx_conversion.max_chunk_tokens == 2000
-        assert config.docx_conversion.chunk_overlap == 200
-        assert config.docx_conversion.extract_metadata is True
-        assert config.docx_conversion.extract_images is True
-
-        # Verify Excel settings
-        assert config.convert_excel is True
-
-    def test_document_archive_profile_mapping(self, converter):
-        """Test Document Archive profile preserves all content."""
-        profile_manager = FileConversionProfileManager()
-        archive_profile = profile_manager.get_profile("document_archive")
-
-        config = converter._map_profile_to_config(archive_profile.settings, "/output")
-
-        # Should preserve everything without chunking
-        assert config.convert_pdf is True
-        assert config.pdf_extraction_mode == "all"
-        assert config.convert_docx is True
-        assert config.docx_conversion.enable_chunking is False  # No chunking for archive
-        assert config.docx_conversion.extract_metadata is True
-        assert config.docx_conversion.extract_images is True
-        assert config.docx_conversion.extract_styles is True
-        assert config.docx_conversion.include_comments is True
-
-    def test_quick_conversion_profile_mapping(self, converter):
-        """Test Quick Conversion profile optimizes for speed."""
-        profile_manager = FileConversionProfileManager()
-        quick_profile = profile_manager.get_profile("quick_conversion")
-
-        config = converter._map_profile_to_config(quick_profile.settings, "/output")
-
-        # Should minimize processing
-        assert config.convert_pdf is True
-        assert config.pdf_extraction_mode == "text"  # Text only
-        assert config.convert_docx is True
-        assert config.docx_conversion.enable_chunking is False
-        assert config.docx_conversion.extract_metadata is False
-        assert config.docx_conversion.extract_images is False
-
-    def test_research_mode_profile_mapping(self, converter):
-        """Test Research Mode profile enables comprehensive extraction."""
-        profile_manager = FileConversionProfileManager()
-        research_profile = profile_manager.get_profile("research_mode")
-
-        config = converter._map_profile_to_config(research_profile.settings, "/output")
-
-        # Should enable everything
-        assert config.convert_pdf is True
-        assert config.pdf_extraction_mode == "all"
-        assert config.convert_docx is True
-        assert config.docx_conversion.enable_chunking is True
-        assert config.docx_conversion.chunk_strategy == "semantic"
-        assert config.docx_conversion.extract_metadata is True
-        assert config.docx_conversion.extract_images is True
-        assert config.docx_conversion.extract_styles is True
-        assert config.docx_conversion.include_comments is True
-
-    def test_batch_optimization_profile_mapping(self, converter):
-        """Test Batch Optimization profile settings for performance."""
-        profile_manager = FileConversionProfileManager()
-        batch_profile = profile_manager.get_profile("batch_optimization")
-
-        config = converter._map_profile_to_config(batch_profile.settings, "/output")
-
-        # Should optimize for speed and throughput
-        assert config.convert_pdf is True
-        assert config.pdf_extraction_mode == "text"
-        assert config.convert_docx is True
-        assert config.docx_conversion.enable_chunking is False
-        assert config.docx_conversion.extract_metadata is False
-        assert config.docx_conversion.extract_images is False
-
-        # Note: max_workers setting would need to be handled separately
-        # as it's not part of the current ProcessingConfig structure
+    @pytest.mark.parametrize(
+        "profile_id, expected",
+        [
+            pytest.param(
+                "ai_processing",
+                {
+                    "convert_pdf": True,
+                    "pdf_extraction_mode": "all",
+                    "convert_docx": True,
+                    "docx_conversion.enabled": True,
+                    "docx_conversion.enable_chunking": True,
+                    "docx_conversion.max_chunk_tokens": 2000,
+                    "docx_conversion.chunk_overlap": 200,
+                    "docx_conversion.extract_metadata": True,
+                    "docx_conversion.extract_images": True,
+                    "convert_excel": True,
+                },
+                id="ai_processing",
+            ),
+            pytest.param(
+                "document_archive",
+                {
+                    # Preserve everything, no chunking
+                    "convert_pdf": True,
+                    "pdf_extraction_mode": "all",
+                    "convert_docx": True,
+                    "docx_conversion.enable_chunking": False,
+                    "docx_conversion.extract_metadata": True,
+                    "docx_conversion.extract_images": True,
+                    "docx_conversion.extract_styles": True,
+                    "docx_conversion.include_comments": True,
+                },
+                id="document_archive",
+            ),
+            pytest.param(
+                "quick_conversion",
+                {
+                    # Minimal processing, text only
+                    "convert_pdf": True,
+                    "pdf_extraction_mode": "text",
+                    "convert_docx": True,
+                    "docx_conversion.enable_chunking": False,
+                    "docx_conversion.extract_metadata": False,
+                    "docx_conversion.extract_images": False,
+                },
+                id="quick_conversion",
+            ),
+            pytest.param(
+                "research_mode",
+                {
+                    # Enable everything
+                    "convert_pdf": True,
+                    "pdf_extraction_mode": "all",
+                    "convert_docx": True,
+                    "docx_conversion.enable_chunking": True,
+                    "docx_conversion.chunk_strategy": "semantic",
+                    "docx_conversion.extract_metadata": True,
+                    "docx_conversion.extract_images": True,
+                    "docx_conversion.extract_styles": True,
+                    "docx_conversion.include_comments": True,
+                },
+                id="research_mode",
+            ),
+            pytest.param(
+                "batch_optimization",
+                {
+                    # Optimize for throughput. max_workers is not part of
+                    # ProcessingConfig, so it is not checked here.
+                    "convert_pdf": True,
+                    "pdf_extraction_mode": "text",
+                    "convert_docx": True,
+                    "docx_conversion.enable_chunking": False,
+                    "docx_conversion.extract_metadata": False,
+                    "docx_conversion.extract_images": False,
+                },
+                id="batch_optimization",
+            ),
+        ],
+    )
+    def test_profile_mapping(self, profile_manager, profile_id, expected):
+        """Test each built-in profile maps to the expected converter settings."""
+        profile = profile_manager.get_profile(profile_id)
+
+        config = InteractiveFileConverter._map_profile_to_config(profile.settings, "/output")
+
+        for field, value in expected.items():
+            actual = attrgetter(field)(config)
+            if isinstance(value, bool):
+                assert actual is value, field
+            else:
+                assert actual == value, field
 
 
 class TestNavigationIntegration:
     """Test navigation context integration with file conversion."""
 
-    @pytest.mark.asyncio
-    async def test_navigation_breadcrumbs_during_conversion(self):
-        """Test navigation breadcrumbs update correctly during conversion workflow."""
-        # Create main CLI with navigation
-        with patch("email_parser.cli.interactive.Console"):
-            cli = InteractiveCLI()
+    @pytest.fixture
+    def cli(self, shared_cli, monkeypatch):
+        """The shared CLI with a fresh navigation context for each test."""
+        monkeypatch.setattr(shared_cli, "navigation", NavigationContext())
+        return shared_cli
 
+    def test_navigation_breadcrumbs_during_conversion(self, cli):
+        """Test navigation breadcrumbs update correctly during conversion workflow."""
+        convert = "Main Menu > Convert Documents"
+        directory = f"{convert} > Directory Selection"
+        steps = [
             # Simulate navigation through menus
-            cli.navigation.push("Convert Documents")
-            assert cli.navigation.get_path() == "Main Menu > Convert Documents"
-
-            cli.navigation.push("Directory Selection")
-            assert (
-                cli.navigation.get_path()
-                == "Main Menu > Convert Documents > Directory Selection"
-            )
-
-            cli.navigation.push("Profile Selection")
-            assert (
-                cli.navigation.get_path()
-                == "Main Menu > Convert Documents > Directory Selection > Profile Selection"
-            )
-
+            ("Convert Documents", convert),
+            ("Directory Selection", directory),
+            ("Profile Selection", f"{directory} > Profile Selection"),
             # Simulate going back
-            cli.navigation.pop()
-            assert (
-                cli.navigation.get_path()
-                == "Main Menu > Convert Documents > Directory Selection"
-            )
-
-            cli.navigation.pop()
-            assert cli.navigation.get_path() == "Main Menu > Convert Documents"
+            (None, directory),
+            (None, convert),
+            (None, "Main Menu"),
+        ]
 
-            cli.navigation.pop()
-            assert cli.navigation.get_path() == "Main Menu"
+        for location, expected in steps:
+            if location is None:
+                cli.navigation.pop()
+            else:
+                cli.navigation.push(location)
+            assert cli.navigation.get_path() == expected
 
-    def test_error_recovery_navigation(self):
+    def test_error_recovery_navigation(self, cli):
         """Test navigation state during error recovery."""
-        with patch("email_parser.cli.interactive.Console"):
-            cli = InteractiveCLI()
+        # Navigate to conversion
+        cli.navigation.push("Convert Documents")
+        cli.navigation.push("Conversion in Progress")
 
-            # Navigate to conversion
-            cli.navigation.push("Convert Documents")
-            cli.navigation.push("Conversion in Progress")
+        # Save state before error
+        pre_error_path = cli.navigation.get_path()
 
-            # Save state before error
-            pre_error_path = cli.navigation.get_path()
+        # Simulate error - should maintain context
+        assert pre_error_path == "Main Menu > Convert Documents > Conversion in Progress"
 
-            # Simulate error - should maintain context
-            assert pre_error_path == "Main Menu > Convert Documents > Conversion in Progress"
+        # After error recovery, should be able to navigate back
+        cli.navigation.pop()
+        assert cli.navigation.get_path() == "Main Menu > Convert Documents"
 
-            # After error recovery, should be able to navigate back
-            cli.navigation.pop()
-            assert cli.navigation.get_path() == "Main Menu > Convert Documents"
-
-    def test_mode_switching_preserves_context(self):
+    def test_mode_switching_preserves_context(self, cli):
         """Test that switching between email and file modes preserves context."""
-        with patch("email_parser.cli.interactive.Console"):
-            cli = InteractiveCLI()
-
-            # Start in email mode
-            cli.navigation.push("Email Processing")
-            cli.navigation.previous_mode = "email"
+        # Start in email mode
+        cli.navigation.push("Email Processing")
+        cli.navigation.previous_mode = "email"
 
-            # Switch to file mode
-            cli.navigation.pop()
-            cli.navigation.push("Convert Documents")
-            previous = cli.navigation.previous_mode
-            cli.navigation.previous_mode = "file"
+        # Switch to file mode
+        cli.navigation.pop()
+        cli.navigation.push("Convert Documents")
+        previous = cli.navigation.previous_mode
+        cli.navigation.previous_mode = "file"
 
-            # Verify mode tracking
-            assert previous == "email"
-            assert cli.navigation.previous_mode == "file"
+        # Verify mode tracking
+        assert previous == "email"
+        assert cli.navigation.previous_mode == "file"
 
-            # Navigation should be independent of mode
-            assert cli.navigation.get_path() == "Main Menu > Convert Documents"
+        # Navigation should be independent of mode
+        assert cli.navigation.get_path() == "Main Menu > Convert Documents"
 
 
 class TestQualityAnalysisIntegration:
     """Test quality analysis integration with conversion workflow."""
 
-    @pytest.fixture
-    def temp_workspace(self):
-        """Create a temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-
-    @pytest.mark.asyncio
-    async def test_post_conversion_quality_analysis(self, temp_workspace):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_post_conversion_quality_analysis(
+        self, shared_converter, profile_manager, tmp_path
+    ):
         """Test quality analysis after successful conversion."""
-        converter = InteractiveFileConverter()
-
         # Create test files
-        original = temp_workspace / "document.pdf"
-        original.write_bytes(b"%PDF-1.4 test content")
+        original = tmp_path / "document.pdf"
+        original.touch()
 
-        converted = temp_workspace / "output" / "converted_pdf" / "document.md"
+        converted = tmp_path / "output" / "converted_pdf" / "document.md"
         converted.parent.mkdir(parents=True, exist_ok=True)
         converted.write_text("# Converted Document\n\nThis is the converted content.")
 
-        files = [
-            ConvertibleFile(
-                path=original,
-                file_type="pdf",
-                size=original.stat().st_size,
-                estimated_conversion_time=2.0,
-                complexity_indicators=[],
-            )
-        ]
+        files = [_make_convertible(original, size=0, estimated_conversion_time=2.0)]
 
         # Mock quality analyzer
-        with patch.object(converter.quality_analyzer, "analyze_batch_quality") as mock_analyze:
+        with patch.object(
+            shared_converter.quality_analyzer, "analyze_batch_quality"
+        ) as mock_analyze:
             mock_analyze.return_value = {
                 "total_files": 1,
                 "analyzed_files": 1,
@@ -495,46 +527,42 @@ class TestQualityAnalysisIntegration:
                 "common_issues": [],
             }
 
-            # Mock display method
-            with patch.object(converter, "_display_batch_quality_results"):
-                await converter._run_quality_analysis(
+            # Mock display method and decline the individual reports
+            with patch.object(shared_converter, "_display_batch_quality_results"), patch(
+                "email_parser.cli.interactive_file.Confirm.ask", return_value=False
+            ):
+                await shared_converter._run_quality_analysis(
                     files,
-                    temp_workspace / "output",
-                    FileConversionProfileManager().get_profile("ai_processing"),
+                    tmp_path / "output",
+                    profile_manager.get_profile("ai_processing"),
                 )
 
             # Verify quality analysis was called
             assert mock_analyze.called
 
-    @pytest.mark.asyncio
-    async def test_quality_analysis_with_failed_conversions(self, temp_workspace):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_quality_analysis_with_failed_conversions(
+        self, shared_converter, profile_manager, tmp_path
+    ):
         """Test quality analysis handling when some conversions fail."""
-        converter = InteractiveFileConverter()
-
         # Create files where one will fail
         files = []
         for i in range(3):
-            file_path = temp_workspace / f"doc_{i}.pdf"
-            file_path.write_bytes(b"%PDF-1.4 content")
-            files.append(
-                ConvertibleFile(
-                    path=file_path,
-                    file_type="pdf",
-                    size=1024,
-                    estimated_conversion_time=1.0,
-                    complexity_indicators=[],
-                )
-            )
+            file_path = tmp_path / f"doc_{i}.pdf"
+            file_path.touch()
+            files.append(_make_convertible(file_path))
 
         # Only create converted files for 2 out of 3
-        output_dir = temp_workspace / "output" / "converted_pdf"
+        output_dir = tmp_path / "output" / "converted_pdf"
         output_dir.mkdir(parents=True, exist_ok=True)
         for i in range(2):  # Only 2 converted files
             converted = output_dir / f"doc_{i}.md"
             converted.write_text(f"Converted content {i}")
 
         # Mock quality analyzer
-        with patch.object(converter.quality_analyzer, "analyze_batch_quality") as mock_analyze:
+        with patch.object(
+            shared_converter.quality_analyzer, "analyze_batch_quality"
+        ) as mock_analyze:
             mock_analyze.return_value = {
                 "total_files": 3,
                 "analyzed_files": 2,  # Only 2 could be analyzed
@@ -542,11 +570,13 @@ class TestQualityAnalysisIntegration:
                 "quality_by_type": {"pdf": {"average": 0.75, "count": 2}},
             }
 
-            with patch.object(converter, "_display_batch_quality_results"):
-                await converter._run_quality_analysis(
+            with patch.object(shared_converter, "_display_batch_quality_results"), patch(
+                "email_parser.cli.interactive_file.Confirm.ask", return_value=False
+            ):
+                await shared_converter._run_quality_analysis(
                     files,
-                    temp_workspace / "output",
-                    FileConversionProfileManager().get_profile("quick_conversion"),
+                    tmp_path / "output",
+                    profile_manager.get_profile("quick_conversion"),
                 )
 
             # Should handle partial results gracefully
@@ -7,10 +7,9 @@ including error handling, file selection, and quality analysis.
 
 import pytest
 import asyncio
+import os
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch
-import tempfile
-import shutil
 
 from email_parser.cli.interactive_file import (
     InteractiveFileConverter, 
@@ -21,52 +20,83 @@ from email_parser.cli.interactive_file import (
 from email_parser.cli.components.error_handler import ConversionErrorHandler, ErrorType
 from email_parser.cli.components.file_selector import CustomFileSelector
 from email_parser.cli.components.quality_analyzer import ConversionQualityAnalyzer
+from email_parser.exceptions.converter_exceptions import APIError
 
+pytestmark = pytest.mark.usefixtures("patch_interactive_console")
 
-class TestInteractiveFileConversion:
-    """Test suite for interactive file conversion integration."""
+# Sample payloads shared by the tests below
+_PDF_CONTENT = b"%PDF-1.4 content"
+_CONVERTED_TEXTS = tuple(f"Document {i} content " * 20 for i in range(3))
+
+# Profiles for _convert_with_profile tests; only read, never mutated
+_EMPTY_PROFILE = ConversionProfile(
+    name="test",
+    description="Test profile",
+    settings={},
+    recommended_for=[]
+)
+_NO_CONVERT_PROFILE = ConversionProfile(
+    name="test",
+    description="Test profile",
+    settings={
+        "convert_pdf": False,
+        "convert_docx": False,
+        "convert_excel": False
+    },
+    recommended_for=[]
+)
+
+
+@pytest.fixture(scope="module")
+def sample_workspace(tmp_path_factory):
+    """Directory of sample PDF, DOCX and XLSX files, written once per module."""
+    workspace = tmp_path_factory.mktemp("sample_workspace")
+    (workspace / "sample.pdf").write_bytes(b"%PDF-1.4 sample content")
+    (workspace / "sample.docx").write_bytes(b"PK\x03\x04 sample docx content")
+    (workspace / "sample.xlsx").write_bytes(b"PK\x03\x04 sample xlsx content")
+    return workspace
+
+
+@pytest.fixture(scope="module")
+def file_selector_samples(tmp_path_factory):
+    """Text files of increasing size plus one PDF, written once per module."""
+    workspace = tmp_path_factory.mktemp("file_selector_samples")
+    files = []
     
-    @pytest.fixture
-    def mock_console(self):
-        """Mock console for testing."""
-        return Mock()
+    # Create files of different sizes; only their size is inspected, so make
+    # them sparse rather than writing the bytes
+    for i in range(5):
+        file_path = workspace / f"file_{i}.txt"
+        file_path.touch()
+        os.truncate(file_path, (i + 1) * 1000)
+        files.append(file_path)
     
-    @pytest.fixture
-    def temp_directory(self):
-        """Create temporary directory for testing."""
-        temp_dir = Path(tempfile.mkdtemp())
-        yield temp_dir
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    # Create a PDF file
+    pdf_file = workspace / "document.pdf"
+    pdf_file.write_bytes(_PDF_CONTENT)
+    files.append(pdf_file)
+    
+    return tuple(files)
+
+
+@pytest.fixture(scope="module")
+def profile_manager():
+    """One FileConversionProfileManager for the module; tests only read profiles."""
+    return FileConversionProfileManager()
+
+
+class TestInteractiveFileConversion:
+    """Test suite for interactive file conversion integration."""
     
     @pytest.fixture
-    def sample_files(self, temp_directory):
-        """Create sample files for testing."""
-        files = []
-        
-        # Create sample PDF file
-        pdf_file = temp_directory / "sample.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4 sample content")
-        files.append(pdf_file)
-        
-        # Create sample DOCX file
-        docx_file = temp_directory / "sample.docx"
-        docx_file.write_bytes(b"PK\x03\x04 sample docx content")
-        files.append(docx_file)
-        
-        # Create sample Excel file
-        xlsx_file = temp_directory / "sample.xlsx"
-        xlsx_file.write_bytes(b"PK\x03\x04 sample xlsx content")
-        files.append(xlsx_file)
-        
-        return files
+    def sample_files(self, sample_workspace):
+        """Read-only sample PDF, DOCX and XLSX files."""
+        return sorted(sample_workspace.iterdir())
     
     @pytest.fixture
-    def converter(self, mock_console):
-        """Create InteractiveFileConverter instance."""
-        with patch('email_parser.cli.interactive_file.Console') as mock_console_class:
-            mock_console_class.return_value = mock_console
-            converter = InteractiveFileConverter()
-            return converter
+    def converter(self):
+        """Fresh converter per test, so no state leaks between tests."""
+        return InteractiveFileConverter()
     
     def test_converter_initialization(self, converter):
         """Test that InteractiveFileConverter initializes all components."""
@@ -79,9 +109,8 @@ class TestInteractiveFileConversion:
         assert converter.file_selector is not None
         assert converter.quality_analyzer is not None
     
-    def test_profile_to_config_mapping(self, converter):
+    def test_profile_to_config_mapping(self, converter, profile_manager):
         """Test profile settings mapping to ProcessingConfig."""
-        profile_manager = FileConversionProfileManager()
         ai_profile = profile_manager.profiles["ai_processing"]
         
         config = converter._map_profile_to_config(ai_profile.settings, "output")
@@ -93,72 +122,58 @@ class TestInteractiveFileConversion:
         assert config.docx_conversion.max_chunk_tokens == 2000
         assert config.docx_conversion.chunk_overlap == 200
     
-    @pytest.mark.asyncio
-    async def test_convert_with_profile_success(self, converter, temp_directory):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_convert_with_profile_success(self, converter, tmp_path):
         """Test successful file conversion with profile."""
         # Create test file
-        test_file = temp_directory / "test.txt"
+        test_file = tmp_path / "test.txt"
         test_file.write_text("Test content")
         
-        # Create test profile
-        test_profile = ConversionProfile(
-            name="test",
-            description="Test profile",
-            settings={
-                "convert_pdf": False,
-                "convert_docx": False,
-                "convert_excel": False
-            },
-            recommended_for=[]
-        )
-        
-        # Mock DirectFileConverter
-        with patch.object(converter, 'direct_converter') as mock_converter:
-            mock_result = Mock()
-            mock_result.success = True
-            mock_result.output_path = temp_directory / "output.txt"
-            mock_result.duration_seconds = 1.5
-            mock_result.error_message = None
-            mock_result.metadata = {}
+        # _convert_with_profile builds its own DirectFileConverter and runs the
+        # synchronous convert_file in an executor, so mock the class with a
+        # plain Mock rather than an AsyncMock
+        with patch('email_parser.cli.interactive_file.DirectFileConverter') as mock_class:
+            mock_converter = mock_class.return_value
+            mock_result = Mock(
+                success=True,
+                output_path=tmp_path / "output.txt",
+                duration_seconds=1.5,
+                error_message=None,
+                metadata={},
+            )
             
             mock_converter.convert_file.return_value = mock_result
             
             result = await converter._convert_with_profile(
-                test_file, test_profile, temp_directory
+                test_file, _NO_CONVERT_PROFILE, tmp_path
             )
             
             assert result['success'] == True
             assert result['duration'] == 1.5
             assert 'output.txt' in result['output_path']
     
-    @pytest.mark.asyncio
-    async def test_convert_with_profile_failure(self, converter, temp_directory):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_convert_with_profile_failure(self, converter, tmp_path):
         """Test file conversion failure handling."""
-        test_file = temp_directory / "test.txt"
+        test_file = tmp_path / "test.txt"
         test_file.write_text("Test content")
         
-        test_profile = ConversionProfile(
-            name="test",
-            description="Test profile",
-            settings={},
-            recommended_for=[]
-        )
-        
         # Mock DirectFileConverter to raise exception
-        with patch.object(converter, 'direct_converter') as mock_converter:
+        with patch('email_parser.cli.interactive_file.DirectFileConverter') as mock_class:
+            mock_converter = mock_class.return_value
             mock_converter.convert_file.side_effect = Exception("Conversion failed")
             
             result = await converter._convert_with_profile(
-                test_file, test_profile, temp_directory
+                test_file, _EMPTY_PROFILE, tmp_path
             )
             
             assert result['success'] == False
             assert "Conversion failed" in result['error']
     
-    def test_find_converted_file(self, converter, temp_directory):
+    def test_find_converted_file(self, converter, tmp_path):
         """Test finding converted files."""
         # Create output directory structure
-        pdf_dir = temp_directory / "converted_pdf"
+        pdf_dir = tmp_path / "converted_pdf"
         pdf_dir.mkdir()
         
         # Create converted file
@@ -166,18 +181,18 @@ class TestInteractiveFileConversion:
         converted_file.write_text("Converted content")
         
         # Test finding the file
-        original_file = temp_directory / "sample.pdf"
+        original_file = tmp_path / "sample.pdf"
         found_file = converter._find_converted_file(
-            original_file, temp_directory, "pdf"
+            original_file, tmp_path, "pdf"
         )
         
         assert found_file == converted_file
     
-    def test_find_converted_file_not_found(self, converter, temp_directory):
+    def test_find_converted_file_not_found(self, converter, tmp_path):
         """Test behavior when converted file is not found."""
-        original_file = temp_directory / "nonexistent.pdf"
+        original_file = tmp_path / "nonexistent.pdf"
         found_file = converter._find_converted_file(
-            original_file, temp_directory, "pdf"
+            original_file, tmp_path, "pdf"
         )
         
         assert found_file is None
@@ -186,32 +201,19 @@ class TestInteractiveFileConversion:
 class TestErrorHandler:
     """Test suite for ConversionErrorHandler."""
     
-    @pytest.fixture
-    def mock_console(self):
-        return Mock()
-    
     @pytest.fixture
     def error_handler(self, mock_console):
         return ConversionErrorHandler(mock_console)
     
-    def test_error_classification(self, error_handler):
+    @pytest.mark.parametrize("exc, expected", [
+        pytest.param(APIError("API key missing"), ErrorType.API_ERROR, id="api"),
+        pytest.param(PermissionError("Access denied"), ErrorType.FILE_ACCESS, id="permission"),
+        pytest.param(MemoryError("Out of memory"), ErrorType.MEMORY_ERROR, id="memory"),
+        pytest.param(ValueError("Something went wrong"), ErrorType.UNKNOWN, id="unknown"),
+    ])
+    def test_error_classification(self, error_handler, exc, expected):
         """Test error classification."""
-        # Test API error
-        from email_parser.exceptions.converter_exceptions import APIError
-        api_error = APIError("API key missing")
-        assert error_handler._classify_error(api_error) == ErrorType.API_ERROR
-        
-        # Test permission error
-        perm_error = PermissionError("Access denied")
-        assert error_handler._classify_error(perm_error) == ErrorType.FILE_ACCESS
-        
-        # Test memory error
-        mem_error = MemoryError("Out of memory")
-        assert error_handler._classify_error(mem_error) == ErrorType.MEMORY_ERROR
-        
-        # Test unknown error
-        unknown_error = ValueError("Something went wrong")
-        assert error_handler._classify_error(unknown_error) == ErrorType.UNKNOWN
+        assert error_handler._classify_error(exc) == expected
     
     def test_recovery_strategies_initialization(self, error_handler):
         """Test that recovery strategies are properly initialized."""
@@ -231,33 +233,16 @@ class TestErrorHandler:
 class TestFileSelector:
     """Test suite for CustomFileSelector."""
     
-    @pytest.fixture
-    def mock_console(self):
-        return Mock()
-    
     @pytest.fixture
     def file_selector(self, mock_console):
         return CustomFileSelector(mock_console)
     
     @pytest.fixture
-    def sample_files(self, tmp_path):
-        """Create sample files for testing."""
-        files = []
-        
-        # Create files of different types and sizes
-        for i in range(5):
-            file_path = tmp_path / f"file_{i}.txt"
-            file_path.write_text(f"Content {i} " * (i + 1) * 100)
-            files.append(file_path)
-        
-        # Create a PDF file
-        pdf_file = tmp_path / "document.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4 content")
-        files.append(pdf_file)
-        
-        return files
+    def sample_files(self, file_selector_samples):
+        """Read-only sample files of different types and sizes."""
+        return list(file_selector_samples)
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_gather_file_metadata(self, file_selector, sample_files):
         """Test file metadata gathering."""
         await file_selector._gather_file_metadata(sample_files)
@@ -278,7 +263,8 @@ class TestFileSelector:
         small_file.write_text("small content")
         
         large_file = tmp_path / "large.txt"
-        large_file.write_text("content " * 10000)  # Large file
+        large_file.touch()
+        os.truncate(large_file, 80_000)  # Large sparse file
         
         small_complexity = file_selector._calculate_complexity(
             small_file, small_file.stat().st_size, "txt"
@@ -305,10 +291,6 @@ class TestFileSelector:
 class TestQualityAnalyzer:
     """Test suite for ConversionQualityAnalyzer."""
     
-    @pytest.fixture
-    def mock_console(self):
-        return Mock()
-    
     @pytest.fixture
     def quality_analyzer(self, mock_console):
         return ConversionQualityAnalyzer(mock_console)
@@ -331,12 +313,11 @@ class TestQualityAnalyzer:
         assert empty_quality == 0
         assert good_quality > bad_quality
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_analyze_conversion_pdf(self, quality_analyzer, tmp_path):
         """Test PDF conversion analysis."""
-        # Create original and converted files
-        original = tmp_path / "document.pdf"
-        original.write_bytes(b"%PDF-1.4 content")
+        # The analyzer only stats the original, so it need not exist on disk
+        original = Mock(spec=Path, **{"stat.return_value.st_size": 16})
         
         converted = tmp_path / "document.md"
         converted.write_text("# Document Title\n\nThis is the converted content.")
@@ -361,11 +342,11 @@ class TestQualityAnalyzer:
         assert any(m.name == "Text Quality" for m in report.metrics)
         assert any(m.name == "OCR Confidence" for m in report.metrics)
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_analyze_conversion_file_not_found(self, quality_analyzer, tmp_path):
         """Test behavior when converted file doesn't exist."""
+        # The original is never opened when the converted file is missing
         original = tmp_path / "document.pdf"
-        original.write_bytes(b"%PDF-1.4 content")
         
         nonexistent = tmp_path / "nonexistent.md"
         
@@ -377,26 +358,28 @@ class TestQualityAnalyzer:
         assert len(report.errors) > 0
         assert "not found" in report.errors[0].lower()
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_batch_quality_analysis(self, quality_analyzer, tmp_path):
         """Test batch quality analysis."""
-        # Create sample conversion results
-        conversion_results = []
+        # Create sample originals and their converted output
+        originals = [tmp_path / f"doc_{i}.pdf" for i in range(3)]
+        for original in originals:
+            original.write_bytes(_PDF_CONTENT)
         
-        for i in range(3):
-            original = tmp_path / f"doc_{i}.pdf"
-            original.write_bytes(b"%PDF-1.4 content")
-            
-            converted = tmp_path / f"doc_{i}.md"
-            converted.write_text(f"Document {i} content " * 20)
-            
-            conversion_results.append({
+        converteds = [tmp_path / f"doc_{i}.md" for i in range(3)]
+        for converted, text in zip(converteds, _CONVERTED_TEXTS):
+            converted.write_text(text)
+        
+        conversion_results = [
+            {
                 'success': True,
                 'input_path': str(original),
                 'output_path': str(converted),
                 'converter_type': 'pdf',
                 'metadata': {}
-            })
+            }
+            for original, converted in zip(originals, converteds)
+        ]
         
         batch_analysis = await quality_analyzer.analyze_batch_quality(conversion_results)
         
@@ -406,59 +389,56 @@ class TestQualityAnalyzer:
         assert 'quality_by_type' in batch_analysis
 
 
+@pytest.fixture(scope="module")
+def temp_workspace(tmp_path_factory):
+    """Create temporary workspace with sample files."""
+    temp_dir = tmp_path_factory.mktemp("workspace")
+    
+    # Create sample files
+    (temp_dir / "sample.txt").write_text("Sample text content")
+    (temp_dir / "document.md").write_text("# Document\n\nMarkdown content")
+    
+    # Create output directory
+    output_dir = temp_dir / "output"
+    output_dir.mkdir()
+    
+    return temp_dir, output_dir
+
+
 @pytest.mark.integration
 class TestFullIntegration:
     """Full integration tests combining all components."""
     
-    @pytest.fixture
-    def temp_workspace(self):
-        """Create temporary workspace with sample files."""
-        temp_dir = Path(tempfile.mkdtemp())
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_end_to_end_workflow(self, temp_workspace, profile_manager):
+        """Test complete end-to-end workflow simulation."""
+        temp_dir, output_dir = temp_workspace
         
-        # Create sample files
-        (temp_dir / "sample.txt").write_text("Sample text content")
-        (temp_dir / "document.md").write_text("# Document\n\nMarkdown content")
+        converter = InteractiveFileConverter()
         
-        # Create output directory
-        output_dir = temp_dir / "output"
-        output_dir.mkdir()
+        # Test file discovery
+        files = list(temp_dir.glob("*"))
+        text_files = [f for f in files if f.is_file()]
         
-        yield temp_dir, output_dir
+        assert len(text_files) >= 2
         
-        shutil.rmtree(temp_dir, ignore_errors=True)
-    
-    @pytest.mark.asyncio
-    async def test_end_to_end_workflow(self, temp_workspace):
-        """Test complete end-to-end workflow simulation."""
-        temp_dir, output_dir = temp_workspace
+        # Test profile mapping
+        test_profile = profile_manager.profiles["quick_conversion"]
         
-        with patch('email_parser.cli.interactive_file.Console'):
-            converter = InteractiveFileConverter()
-            
-            # Test file discovery
-            files = list(temp_dir.glob("*"))
-            text_files = [f for f in files if f.is_file()]
-            
-            assert len(text_files) >= 2
-            
-            # Test profile mapping
-            profile_manager = FileConversionProfileManager()
-            test_profile = profile_manager.profiles["quick_conversion"]
-            
-            config = converter._map_profile_to_config(test_profile.settings, str(output_dir))
-            
-            assert config is not None
-            assert config.output_directory == str(output_dir)
-            
-            # Test error handler initialization
-            assert converter.error_handler is not None
-            assert len(converter.error_handler.recovery_strategies) > 0
-            
-            # Test quality analyzer initialization
-            assert converter.quality_analyzer is not None
-            
-            # This test verifies that all components can be initialized and
-            # basic operations work without errors
+        config = converter._map_profile_to_config(test_profile.settings, str(output_dir))
+        
+        assert config is not None
+        assert config.output_directory == str(output_dir)
+        
+        # Test error handler initialization
+        assert converter.error_handler is not None
+        assert len(converter.error_handler.recovery_strategies) > 0
+        
+        # Test quality analyzer initialization
+        assert converter.quality_analyzer is not None
+        
+        # This test verifies that all components can be initialized and
+        # basic operations work without errors
 
 
 if __name__ == "__main__":
@@ -4,10 +4,14 @@ These tests require a valid MISTRALAI_API_KEY environment variable.
 They test real API connectivity and response handling.
 """
 
+import asyncio
+import gc
 import os
+import sys
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 import pytest
 import psutil
 import requests
@@ -15,16 +19,75 @@ from email_parser.converters.pdf_converter import PDFConverter
 from email_parser.exceptions.converter_exceptions import ConversionError, APIError
 
 
+def _fake_response(status_code, json_body=None, headers=None):
+    """Build a ``requests`` response mock in a single call."""
+    return Mock(
+        status_code=status_code,
+        headers=headers or {},
+        **{"json.return_value": json_body},
+    )
+
+
+@contextmanager
+def gc_disabled():
+    """Suspend automatic garbage collection for the duration of the block."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _network_disabled(*args, **kwargs):
+    raise RuntimeError("network disabled")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _block_network():
+    """Fail fast on real HTTP traffic when no API key is configured.
+
+    Live tests (``api_key`` users and ``live``-marked tests) are skipped
+    without ``MISTRALAI_API_KEY``, so any request made by the remaining tests
+    is an accident. The Mistral SDK talks over httpx, so its transports are
+    blocked alongside ``requests``. Mocks such as
+    ``patch('requests.post')`` are applied inside the test and still win.
+    """
+    if os.environ.get("MISTRALAI_API_KEY"):
+        yield
+        return
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(requests.Session, "request", _network_disabled)
+        mp.setattr(requests, "post", _network_disabled)
+        try:
+            import httpx
+        except ImportError:
+            pass
+        else:
+            mp.setattr(httpx.HTTPTransport, "handle_request", _network_disabled)
+            mp.setattr(httpx.AsyncHTTPTransport, "handle_async_request", _network_disabled)
+        yield
+
+
+@pytest.fixture(scope="module")
+def current_process():
+    """psutil handle for this test process, opened once per module."""
+    return psutil.Process()
+
+
 class TestMistralAPILive:
     """Live API tests for MistralAI integration."""
     
     @pytest.fixture
     def api_key(self):
-        """Get API key from environment, skip test if not available."""
-        key = os.getenv("MISTRALAI_API_KEY")
-        if not key:
-            pytest.skip("MISTRALAI_API_KEY not set - skipping live API tests")
-        return key
+        """Get API key from environment.
+
+        Tests using this fixture are skipped at collection time when the key is
+        not set; see ``tests/integration/conftest.py``.
+        """
+        return os.environ["MISTRALAI_API_KEY"]
     
     @pytest.fixture
     def converter(self, api_key):
@@ -44,6 +107,7 @@ class TestMistralAPILive:
         assert converter.api_key == api_key
         assert converter._validate_api_key()
     
+    @pytest.mark.live
     def test_api_connection_invalid_key(self):
         """Test API connection with invalid key."""
         converter = PDFConverter(api_key="invalid_key_12345")
@@ -75,19 +139,15 @@ class TestMistralAPILive:
     def test_rate_limiting_response(self, converter):
         """Test rate limiting handling."""
         # Mock rate limit response
-        with patch('requests.post') as mock_post:
-            mock_response = mock_post.return_value
-            mock_response.status_code = 429
-            mock_response.json.return_value = {"error": "rate_limit_exceeded"}
-            mock_response.headers = {"Retry-After": "1"}
-            
+        rate_limited = _fake_response(
+            429, {"error": "rate_limit_exceeded"}, {"Retry-After": "1"}
+        )
+        with patch('requests.post', return_value=rate_limited):
             with pytest.raises(APIError) as exc_info:
                 converter._call_mistral_api(b"dummy pdf content")
             
             assert "rate limit" in str(exc_info.value).lower()
     
-    @pytest.mark.skipif(not os.getenv("MISTRALAI_API_KEY"), 
-                       reason="No API key available for live testing")
     def test_small_pdf_conversion(self, converter, test_output_dir):
         """Test conversion of a small valid PDF."""
         # Create a minimal test PDF (would need actual PDF content)
@@ -99,16 +159,22 @@ class TestMistralAPILive:
         
         assert "not found" in str(exc_info.value).lower()
     
-    @pytest.mark.skipif(not os.getenv("MISTRALAI_API_KEY"), 
-                       reason="No API key available for live testing")
     def test_large_pdf_handling(self, converter, test_output_dir):
         """Test handling of large PDF files (>5MB)."""
         # Create a mock large file
         large_pdf = test_output_dir / "large.pdf"
         
-        # Write 6MB of dummy data
-        with open(large_pdf, "wb") as f:
-            f.write(b"dummy pdf content" * (6 * 1024 * 1024 // 17))
+        # Reserve 6MB in one syscall instead of building the data in Python
+        large_size = 6 * 1024 * 1024
+        fd = os.open(large_pdf, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(fd, 0, large_size)
+            else:
+                # macOS/Windows: a sparse file of the same size
+                os.ftruncate(fd, large_size)
+        finally:
+            os.close(fd)
         
         # Should validate file size before API call
         with pytest.raises(ConversionError) as exc_info:
@@ -131,8 +197,7 @@ class TestMistralAPILive:
         assert any(keyword in str(exc_info.value).lower() 
                   for keyword in ["invalid", "format", "corrupted"])
     
-    @pytest.mark.skipif(not os.getenv("MISTRALAI_API_KEY"), 
-                       reason="No API key available for live testing")
+    @pytest.mark.serial
     def test_api_response_time_benchmark(self, converter):
         """Benchmark API response times."""
         start_time = time.time()
@@ -150,10 +215,9 @@ class TestMistralAPILive:
             response_time = time.time() - start_time
             pytest.fail(f"API call failed in {response_time:.2f}s: {e}")
     
-    def test_memory_usage_tracking(self, converter, test_output_dir):
+    def test_memory_usage_tracking(self, converter, test_output_dir, current_process):
         """Test memory usage during PDF processing."""
-        process = psutil.Process()
-        initial_memory = process.memory_info().rss
+        initial_memory = current_process.memory_info().rss
         
         # Create small test file
         test_pdf = test_output_dir / "small.pdf"
@@ -166,144 +230,117 @@ class TestMistralAPILive:
             # Expected for invalid PDF, but still check memory
             pass
         
-        final_memory = process.memory_info().rss
+        final_memory = current_process.memory_info().rss
         memory_increase = final_memory - initial_memory
         
         # Memory increase should be reasonable (<10MB for small files)
         assert memory_increase < 10 * 1024 * 1024, \
                f"Memory usage too high: {memory_increase / 1024 / 1024:.2f}MB"
     
-    def test_concurrent_request_handling(self, converter, test_output_dir):
-        """Test handling of concurrent API requests."""
-        import threading
-        import queue
-        
-        results = queue.Queue()
-        
-        def make_request():
-            try:
-                # Test key validation concurrently
-                result = converter._validate_api_key()
-                results.put(("success", result))
-            except Exception as e:
-                results.put(("error", str(e)))
-        
-        # Start 3 concurrent requests
-        threads = []
-        for _ in range(3):
-            thread = threading.Thread(target=make_request)
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all threads
-        for thread in threads:
-            thread.join(timeout=10)
-        
-        # Collect results
-        success_count = 0
-        error_count = 0
-        
-        while not results.empty():
-            result_type, _ = results.get()
-            if result_type == "success":
-                success_count += 1
-            else:
-                error_count += 1
-        
-        # At least some requests should succeed
-        assert success_count > 0, "No concurrent requests succeeded"
-    
     def test_resource_cleanup_validation(self, converter, test_output_dir):
         """Test that resources are properly cleaned up after operations."""
-        import gc
-        
-        # Track initial object count
-        gc.collect()
-        initial_objects = len(gc.get_objects())
-        
-        # Perform operation that should clean up after itself
+        # Track allocated blocks, an O(1) stand-in for scanning every live object.
+        # A warm-up call first absorbs one-off allocations (lazy imports, caches),
+        # so the measured call reflects steady state. Automatic collection is held
+        # off so it cannot fire mid-measurement.
         test_file = test_output_dir / "cleanup_test.pdf"
-        with open(test_file, "wb") as f:
-            f.write(b"test content")
+        test_file.write_bytes(b"test content")
         
-        try:
-            converter.convert(test_file, test_output_dir)
-        except ConversionError:
-            # Expected for invalid PDF
-            pass
+        def convert_once():
+            try:
+                converter.convert(test_file, test_output_dir)
+            except ConversionError:
+                # Expected for invalid PDF
+                pass
         
-        # Force garbage collection
-        gc.collect()
-        final_objects = len(gc.get_objects())
+        convert_once()
         
-        # Object count shouldn't grow excessively
-        object_growth = final_objects - initial_objects
-        assert object_growth < 100, \
-               f"Potential memory leak: {object_growth} new objects"
+        with gc_disabled():
+            gc.collect(generation=2)
+            initial_blocks = sys.getallocatedblocks()
+            
+            # Perform operation that should clean up after itself
+            convert_once()
+            
+            gc.collect(generation=2)
+            final_blocks = sys.getallocatedblocks()
+        
+        # Measured steady-state growth is 0 (+/-1) blocks per call; a leak of
+        # even one object graph per call shows up as dozens of blocks
+        block_growth = final_blocks - initial_blocks
+        assert block_growth < 32, \
+               f"Potential memory leak: {block_growth} new allocated blocks"
+
+
+@pytest.fixture(scope="module")
+def dummy_converter():
+    """PDF converter with a placeholder key, shared by the offline error tests."""
+    return PDFConverter(api_key="test_key_0123456789")
 
 
 class TestMistralAPIErrorScenarios:
     """Test specific API error scenarios."""
     
-    def test_corrupted_pdf_api_response(self):
+    def test_corrupted_pdf_api_response(self, dummy_converter):
         """Test API response to corrupted PDF."""
-        converter = PDFConverter(api_key="test_key")
-        
-        with patch('requests.post') as mock_post:
-            mock_response = mock_post.return_value
-            mock_response.status_code = 400
-            mock_response.json.return_value = {
-                "error": "invalid_file_format",
-                "message": "File is not a valid PDF"
-            }
-            
+        bad_request = _fake_response(
+            400, {"error": "invalid_file_format", "message": "File is not a valid PDF"}
+        )
+        with patch('requests.post', return_value=bad_request):
             with pytest.raises(ConversionError) as exc_info:
-                converter._call_mistral_api(b"corrupted content")
+                dummy_converter._call_mistral_api(b"corrupted content")
             
             assert "invalid" in str(exc_info.value).lower()
     
-    def test_zero_byte_file_handling(self):
+    def test_zero_byte_file_handling(self, dummy_converter):
         """Test handling of zero-byte files."""
-        converter = PDFConverter(api_key="test_key")
-        
         with pytest.raises(ConversionError) as exc_info:
-            converter._validate_pdf_content(b"")
+            dummy_converter._validate_pdf_content(b"")
         
         assert "empty" in str(exc_info.value).lower()
     
-    def test_password_protected_pdf_detection(self):
+    def test_password_protected_pdf_detection(self, dummy_converter):
         """Test detection of password-protected PDFs."""
-        converter = PDFConverter(api_key="test_key")
-        
         # Mock PDF content that indicates password protection
         protected_content = b"%PDF-1.4\n/Encrypt"
         
         with pytest.raises(ConversionError) as exc_info:
-            converter._validate_pdf_content(protected_content)
+            dummy_converter._validate_pdf_content(protected_content)
         
         assert any(keyword in str(exc_info.value).lower() 
                   for keyword in ["password", "protected", "encrypted"])
     
-    def test_extremely_large_pdf_rejection(self):
+    def test_extremely_large_pdf_rejection(self, dummy_converter):
         """Test rejection of extremely large PDFs."""
-        converter = PDFConverter(api_key="test_key")
-        
         # Mock 150MB file
         large_size = 150 * 1024 * 1024
         
         with pytest.raises(ConversionError) as exc_info:
-            converter._validate_file_size(large_size)
+            dummy_converter._validate_file_size(large_size)
         
         assert "size" in str(exc_info.value).lower()
     
-    def test_non_pdf_extension_detection(self):
+    def test_non_pdf_extension_detection(self, dummy_converter):
         """Test detection of non-PDF files with .pdf extension."""
-        converter = PDFConverter(api_key="test_key")
-        
         # Text file content with PDF extension
         fake_pdf_content = b"This is just a text file"
         
         with pytest.raises(ConversionError) as exc_info:
-            converter._validate_pdf_content(fake_pdf_content)
+            dummy_converter._validate_pdf_content(fake_pdf_content)
         
-        assert "not a valid PDF" in str(exc_info.value)
\ No newline at end of file
+        assert "not a valid PDF" in str(exc_info.value)
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_request_handling(self, dummy_converter):
+        """Test handling of concurrent API requests."""
+        # Mock the transport so only client-side concurrency is exercised
+        with patch.object(dummy_converter.client.chat, "complete", return_value=Mock()):
+            # Test key validation concurrently
+            results = await asyncio.gather(
+                *(asyncio.to_thread(dummy_converter._validate_api_key) for _ in range(3)),
+                return_exceptions=True,
+            )
+        
+        errors = [result for result in results if isinstance(result, Exception)]
+        assert not errors, f"Concurrent requests failed: {errors}"
+        assert results == [True, True, True]
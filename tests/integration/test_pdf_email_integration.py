@@ -15,13 +15,9 @@ from email_parser.core.email_processor import EmailProcessor
 from email_parser.exceptions.parsing_exceptions import PDFConversionError
 
 
-class TestPDFEmailIntegration:
-    """Test PDF conversion integration with email processing."""
-    
-    @pytest.fixture
-    def email_with_pdf(self, tmp_path):
-        """Create a test email with PDF attachment."""
-        email_content = """From: sender@example.com
+# Raw email with a small PDF attachment, built once at import; process_email
+# accepts bytes, so tests need no file round-trip
+_EMAIL_WITH_PDF = b"""From: sender@example.com
 To: recipient@example.com
 Subject: Test Email with PDF
 MIME-Version: 1.0
@@ -44,9 +40,26 @@ cmVmCjE5MAolJUVPRgo=
 
 --boundary123--
 """
-        email_file = tmp_path / "test_email.eml"
-        email_file.write_text(email_content)
-        return str(email_file)    
+
+
+@pytest.fixture(scope="module")
+def mock_mistral_response():
+    """Canned MistralAI OCR response, built once and shared across tests."""
+    page = Mock(
+        markdown="# Converted PDF Content\n\nThis is the converted document.",
+        images=[],
+    )
+    return Mock(pages=[page])
+
+
+class TestPDFEmailIntegration:
+    """Test PDF conversion integration with email processing."""
+    
+    @pytest.fixture
+    def email_with_pdf(self):
+        """Raw bytes of a test email with PDF attachment."""
+        return _EMAIL_WITH_PDF
+    
     @pytest.fixture
     def processing_config(self, tmp_path):
         """Create processing configuration with PDF conversion enabled."""
@@ -61,39 +74,49 @@ cmVmCjE5MAolJUVPRgo=
         )
         return config
     
-    @patch('email_parser.converters.pdf_converter.MistralClient')
-    def test_email_with_pdf_conversion(self, mock_client_class, email_with_pdf, processing_config):
+    @pytest.fixture
+    def mock_client_class(self):
+        """Patch the MistralAI client class the PDF converter instantiates."""
+        with patch('email_parser.converters.pdf_converter.Mistral') as client_class:
+            yield client_class
+    
+    @pytest.fixture
+    def processor(self, processing_config, mock_client_class, monkeypatch):
+        """Create an email processor for the PDF-enabled configuration.
+        
+        The API key and mocked client must be in place before the processor
+        builds its PDF converter.
+        """
+        monkeypatch.setenv('MISTRALAI_API_KEY', 'test-key-0123456789')
+        return EmailProcessor(processing_config)
+    
+    def test_email_with_pdf_conversion(self, mock_client_class, email_with_pdf,
+                                       processor, processing_config,
+                                       mock_mistral_response):
         """Test processing email with PDF attachment and conversion enabled."""
         # Mock successful API response
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.parsed.text = "# Converted PDF Content\n\nThis is the converted document."
-        mock_client.chat.complete.return_value = mock_response
-        mock_client_class.return_value = mock_client
+        mock_client_class.return_value.ocr.process.return_value = mock_mistral_response
         
         # Process email
-        processor = EmailProcessor(processing_config)
-        
-        with patch.dict(os.environ, {'MISTRALAI_API_KEY': 'test-key'}):
-            result = processor.process_email(email_with_pdf)
+        result = processor.process_email(email_with_pdf)
         
         # Verify PDF was processed
         assert len(result['attachments']) == 1
-        assert result['attachments'][0]['filename'] == 'document.pdf'
+        assert result['attachments'][0]['original_filename'] == 'document.pdf'
         
         # Check for converted markdown
         converted_dir = Path(processing_config.output_directory) / "converted_pdf"
         assert converted_dir.exists()
         
-        # Find the converted markdown file
-        md_files = list(converted_dir.glob("*.md"))
+        # Find the converted markdown file, written to a per-PDF subdirectory
+        md_files = list(converted_dir.rglob("*.md"))
         assert len(md_files) == 1        
         # Verify content
         with open(md_files[0], 'r') as f:
             content = f.read()
         assert "Converted PDF Content" in content
     
-    def test_email_without_pdf(self, processing_config):
+    def test_email_without_pdf(self, processor, processing_config):
         """Test processing email without PDF attachments."""
         email_content = """From: sender@example.com
 To: recipient@example.com
@@ -101,11 +124,9 @@ Subject: Simple Text Email
 
 This is a simple text email without attachments.
 """
-        processor = EmailProcessor(processing_config)
-        
         # This should process without errors even with PDF conversion enabled
         # Just won't create any PDF conversions
-        result = processor.process_email_from_string(email_content)
+        result = processor.process_email(email_content.encode())
         
         assert len(result['attachments']) == 0
         
@@ -117,6 +138,8 @@ This is a simple text email without attachments.
     @patch.dict(os.environ, {}, clear=True)
     def test_pdf_conversion_without_api_key(self, email_with_pdf, processing_config):
         """Test graceful handling when API key is missing."""
+        # Built here rather than via the processor fixture so the converter
+        # is constructed while the environment is cleared
         processor = EmailProcessor(processing_config)
         
         # Should process email but skip PDF conversion
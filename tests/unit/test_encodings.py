@@ -0,0 +1,48 @@
+"""
+Unit tests for the encoding utilities.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from email_parser.exceptions.parsing_exceptions import EncodingError
+from email_parser.utils import encodings
+from email_parser.utils.encodings import decode_transfer_encoding
+
+# The accelerated decoder as installed, and the stdlib fallback
+DECODERS = (("pybase64", encodings.pybase64), ("stdlib", None))
+
+
+class TestDecodeTransferEncoding(unittest.TestCase):
+    """Test cases for decode_transfer_encoding."""
+
+    def test_base64(self) -> None:
+        """Test decoding of well-formed base64."""
+        for name, decoder in DECODERS:
+            with self.subTest(name), patch.object(encodings, "pybase64", decoder):
+                self.assertEqual(decode_transfer_encoding(b"aGVsbG8=", "base64"), b"hello")
+
+    def test_base64_unpadded(self) -> None:
+        """Test that missing padding is repaired."""
+        for name, decoder in DECODERS:
+            with self.subTest(name), patch.object(encodings, "pybase64", decoder):
+                self.assertEqual(decode_transfer_encoding(b"aGVsbG8", "base64"), b"hello")
+
+    def test_base64_non_alphabet_characters(self) -> None:
+        """Test that characters outside the base64 alphabet are discarded."""
+        for name, decoder in DECODERS:
+            with self.subTest(name), patch.object(encodings, "pybase64", decoder):
+                self.assertEqual(
+                    decode_transfer_encoding(b"aGVs!bG8=\r\n", "base64"), b"hello"
+                )
+
+    def test_base64_malformed(self) -> None:
+        """Test that undecodable base64 raises EncodingError."""
+        for name, decoder in DECODERS:
+            with self.subTest(name), patch.object(encodings, "pybase64", decoder):
+                with self.assertRaises(EncodingError):
+                    decode_transfer_encoding(b"aGVsb", "base64")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -342,6 +342,41 @@ class TestProfileRecommendationLogic:
         recommendation = manager.recommend_profile(files)
         assert recommendation == "quick_conversion"  # Size wins over complexity
 
+    def test_streaming_recommendation_matches_bulk(self, manager):
+        """Test running statistics give the same answer as a bulk file list."""
+        files = [
+            ConvertibleFile(
+                path="/test/complex.pdf",
+                file_type="pdf",
+                size=8 * 1024 * 1024,
+                estimated_conversion_time=5.0,
+                complexity_indicators=["complex"],
+            ),
+            ConvertibleFile(
+                path="/test/huge.docx",
+                file_type="docx",
+                size=110 * 1024 * 1024,
+                estimated_conversion_time=20.0,
+                complexity_indicators=[],
+            ),
+        ]
+
+        # Empty stats fall back to the default profile
+        assert manager.recommend_profile() == "ai_processing"
+
+        manager.add_file(files[0])
+        assert manager.recommend_profile() == "research_mode"
+        assert manager.recommend_profile() == manager.recommend_profile(files[:1])
+
+        manager.add_file(files[1])
+        assert manager.recommend_profile() == "quick_conversion"
+        assert manager.recommend_profile() == manager.recommend_profile(files)
+
+        assert manager.estimated_total_time == 25.0
+
+        manager.reset_file_stats()
+        assert manager.recommend_profile() == "ai_processing"
+
 
 class TestProfileToConfigMapping:
     """Test mapping profiles to ProcessingConfig."""
@@ -55,6 +55,20 @@ class TestConvertibleFile:
 
         assert file.size_mb == 5.0
 
+    def test_convertible_file_is_slotted_and_frozen(self):
+        """Test ConvertibleFile carries no per-instance __dict__ and is immutable."""
+        file = ConvertibleFile(
+            path=Path("/test/file.pdf"),
+            file_type="pdf",
+            size=1024,
+            estimated_conversion_time=1.0,
+            complexity_indicators=[],
+        )
+
+        assert not hasattr(file, "__dict__")
+        with pytest.raises(AttributeError):
+            file.size = 2048
+
 
 class TestFileDiscoveryResult:
     """Test FileDiscoveryResult dataclass."""
@@ -387,6 +401,10 @@ class TestInteractiveFileConverter:
         assert len(result.convertible_files) == 3  # PDF, DOCX, XLSX
         assert result.total_size == 6 * 1024 * 1024  # 3 files * 2MB
         assert result.total_size_mb == 6.0
+        assert result.estimated_total_time == sum(
+            f.estimated_conversion_time for f in result.convertible_files
+        )
+        assert converter.profile_manager.recommend_profile() == "ai_processing"
 
     def test_map_profile_to_config(self, converter):
         """Test mapping conversion profile to ProcessingConfig."""
@@ -2,6 +2,7 @@
 Unit tests for the MIME parser.
 """
 
+import base64
 import os
 import unittest
 from unittest.mock import patch, MagicMock
@@ -124,6 +125,35 @@ VGhpcyBpcyBhIHRlc3QgYXR0YWNobWVudC4=
         self.assertEqual(parts[0]["part_id"], "test_part")
         self.assertEqual(parts[0]["content_type"], "text/plain")
 
+    def test_large_base64_attachment(self) -> None:
+        """Test decoding of a multi-megabyte base64 attachment."""
+        data = os.urandom(5 * 1024 * 1024)
+        email_bytes = (
+            b"From: sender@example.com\n"
+            b"Subject: Large Attachment\n"
+            b'Content-Type: multipart/mixed; boundary="boundary"\n\n'
+            b"--boundary\n"
+            b"Content-Type: application/pdf\n"
+            b'Content-Disposition: attachment; filename="large.pdf"\n'
+            b"Content-Transfer-Encoding: base64\n\n"
+            + base64.encodebytes(data)
+            + b"\n--boundary--\n"
+        )
+
+        # With the accelerated decoder and with the stdlib fallback
+        for accelerated in (True, False):
+            with self.subTest(accelerated=accelerated):
+                parser = MIMEParser()
+                if accelerated:
+                    parser.parse_email(email_bytes)
+                else:
+                    with patch("email_parser.utils.encodings.pybase64", None):
+                        parser.parse_email(email_bytes)
+
+                attachments = parser.get_attachments()
+                self.assertEqual(len(attachments), 1)
+                self.assertEqual(attachments[0]["content"], data)
+
     def test_get_inline_images(self) -> None:
         """Test extraction of inline images."""
         # Add a mock inline image part